@@ -103,6 +103,7 @@ CATEGORY_TOOLS: dict[str, list[str]] = {
         "confluence_get_page_history",
         "confluence_move_page",
         "confluence_get_page_diff",
+        "confluence_batch",
     ],
     "confluence-search": [
         "confluence_search",
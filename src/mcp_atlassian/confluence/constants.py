@@ -47,4 +47,8 @@ RESERVED_CQL_WORDS = {
     "update",
 }
 
+# Content formats accepted by update_page_section. The section is edited in
+# the page's storage format, so wiki markup is not accepted.
+SECTION_CONTENT_FORMATS = frozenset({"markdown", "storage"})
+
 # Add other Confluence-specific constants here if needed in the future.
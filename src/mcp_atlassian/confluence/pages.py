@@ -11,11 +11,15 @@ from requests.exceptions import HTTPError
 from ..models.confluence import ConfluencePage
 from ..utils.decorators import handle_auth_errors
 from .client import ConfluenceClient
+from .constants import SECTION_CONTENT_FORMATS
 from .utils import emoji_to_hex_id, extract_emoji_from_property
 from .v2_adapter import ConfluenceV2Adapter
 
 logger = logging.getLogger("mcp-atlassian")
 
+# Accepted values, checked before any API call is made
+_PAGE_WIDTHS = frozenset({"full-width", "max", "default"})
+
 
 class PagesMixin(ConfluenceClient):
     """Mixin for Confluence page operations."""
@@ -430,7 +434,7 @@ class PagesMixin(ConfluenceClient):
         """
         try:
             # Validate width value
-            if width is not None and width not in ["full-width", "max", "default"]:
+            if width is not None and width not in _PAGE_WIDTHS:
                 logger.warning(
                     f"Invalid page width '{width}'. Must be 'full-width', 'max', or 'default'"
                 )
@@ -856,7 +860,7 @@ class PagesMixin(ConfluenceClient):
                 ``content_format`` is not one of the accepted values.
             Exception: If retrieving or updating the page fails.
         """
-        if content_format not in ("markdown", "storage"):
+        if content_format not in SECTION_CONTENT_FORMATS:
             raise ValueError(
                 f"Invalid content_format '{content_format}'. "
                 "Must be 'markdown' or 'storage'."
@@ -1086,11 +1090,11 @@ class PagesMixin(ConfluenceClient):
             # has a broken termination condition when limit > server-side cap.
             page_size = 200
             start = 0
-            all_pages: list[dict[str, Any]] = []
+            result_pages: list[dict[str, Any]] = []
             next_link: str | None = None
 
-            while len(all_pages) < limit:
-                fetch_limit = min(page_size, limit - len(all_pages))
+            while len(result_pages) < limit:
+                fetch_limit = min(page_size, limit - len(result_pages))
                 response = self.confluence.get_all_pages_from_space_raw(
                     space=space_key,
                     start=start,
@@ -1098,16 +1102,40 @@ class PagesMixin(ConfluenceClient):
                     expand="ancestors",
                 )
                 batch = response.get("results", [])
-                all_pages.extend(batch)
+                # Reduce each raw page (with its full ancestor chain) to the
+                # few fields we return as soon as it arrives, so large spaces
+                # never hold every raw API response in memory at once.
+                for page in batch:
+                    # Position is auto-included via extensions in the v1 API
+                    position = page.get("extensions", {}).get("position")
+
+                    # Determine parent and depth from ancestors
+                    ancestors = page.get("ancestors", [])
+                    if ancestors:
+                        parent_id = ancestors[-1].get("id")
+                        depth = len(ancestors)
+                    else:
+                        parent_id = None
+                        depth = 0
+
+                    result_pages.append(
+                        {
+                            "id": page.get("id"),
+                            "title": page.get("title", "Untitled"),
+                            "parent_id": parent_id,
+                            "position": position,
+                            "depth": depth,
+                        }
+                    )
 
                 next_link = response.get("_links", {}).get("next")
                 if not batch or not next_link:
                     break
                 start += len(batch)
 
-            has_more = len(all_pages) >= limit and bool(next_link)
+            has_more = len(result_pages) >= limit and bool(next_link)
 
-            if not all_pages:
+            if not result_pages:
                 return {
                     "space_key": space_key,
                     "total_pages": 0,
@@ -1115,35 +1143,6 @@ class PagesMixin(ConfluenceClient):
                     "pages": [],
                 }
 
-            # Build flat list with parent_id and depth
-            result_pages = []
-
-            for page in all_pages:
-                page_id = page.get("id")
-                title = page.get("title", "Untitled")
-
-                # Position is auto-included via extensions in the v1 API
-                position = page.get("extensions", {}).get("position")
-
-                # Determine parent and depth from ancestors
-                ancestors = page.get("ancestors", [])
-                if ancestors:
-                    parent_id = ancestors[-1].get("id")
-                    depth = len(ancestors)
-                else:
-                    parent_id = None
-                    depth = 0
-
-                result_pages.append(
-                    {
-                        "id": page_id,
-                        "title": title,
-                        "parent_id": parent_id,
-                        "position": position,
-                        "depth": depth,
-                    }
-                )
-
             # Sort by depth first (breadth-first), then by position
             # Note: position can be 0 (valid), so check for None explicitly
             result_pages.sort(
@@ -63,6 +63,24 @@ def emoji_to_hex_id(emoji: str) -> str:
     return "-".join(code_points)
 
 
+def quote_cql_string(value: str) -> str:
+    """
+    Quotes a value as a CQL string literal.
+
+    Backslashes and double quotes inside the value are escaped, so free-text
+    input (e.g. a search term) cannot break out of the literal.
+
+    Args:
+        value: The raw string value.
+
+    Returns:
+        The value wrapped in double quotes, with internal quotes escaped.
+    """
+    # Escape internal backslashes first, then double quotes
+    escaped_value = value.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped_value}"'
+
+
 def quote_cql_identifier_if_needed(identifier: str) -> str:
     """
     Quotes a Confluence identifier for safe use in CQL literals if required.
@@ -111,9 +129,7 @@ def quote_cql_identifier_if_needed(identifier: str) -> str:
     #    needs_quoting = True
 
     if needs_quoting:
-        # Escape internal backslashes first, then double quotes
-        escaped_identifier = identifier.replace("\\", "\\\\").replace('"', '\\"')
-        quoted_escaped = f'"{escaped_identifier}"'
+        quoted_escaped = quote_cql_string(identifier)
         logger.debug(f"Quoted and escaped identifier: {quoted_escaped}")
         return quoted_escaped
     else:
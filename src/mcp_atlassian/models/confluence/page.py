@@ -252,6 +252,20 @@ class ConfluencePage(ApiModel, TimestampMixin):
 
     def to_simplified_dict(self) -> dict[str, Any]:
         """Convert to simplified dictionary for API response."""
+        result = self.to_metadata_dict()
+
+        # Add content if it's not empty
+        if self.content and self.content_format:
+            result["content"] = {"value": self.content, "format": self.content_format}
+
+        return result
+
+    def to_metadata_dict(self) -> dict[str, Any]:
+        """Convert to simplified dictionary without the page body.
+
+        Same as to_simplified_dict() minus "content", for responses that only
+        need page metadata and should not carry the (possibly large) body.
+        """
         result = {
             "id": self.id,
             "title": self.title,
@@ -278,10 +292,6 @@ class ConfluencePage(ApiModel, TimestampMixin):
             attachment.to_simplified_dict() for attachment in self.attachments
         ]
 
-        # Add content if it's not empty
-        if self.content and self.content_format:
-            result["content"] = {"value": self.content, "format": self.content_format}
-
         # Add ancestors if there are any
         if self.ancestors:
             result["ancestors"] = [
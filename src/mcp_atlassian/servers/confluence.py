@@ -1,30 +1,260 @@
 """Confluence FastMCP server instance and tool definitions."""
 
+import asyncio
 import base64
+import inspect
 import json
 import logging
 import mimetypes
-from typing import Annotated
+from collections.abc import Awaitable, Callable
+from functools import wraps
+from typing import Annotated, Any, TypeVar
 
+import orjson
 from fastmcp import Context, FastMCP
 from mcp.types import BlobResourceContents, EmbeddedResource, ImageContent, TextContent
 from pydantic import BeforeValidator, Field
+from requests.exceptions import HTTPError
 
+from mcp_atlassian.confluence.constants import SECTION_CONTENT_FORMATS
+from mcp_atlassian.confluence.utils import quote_cql_string
 from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 from mcp_atlassian.models.confluence import ConfluenceAttachment
-from mcp_atlassian.servers.dependencies import get_confluence_fetcher
+from mcp_atlassian.servers.dependencies import (
+    get_app_lifespan_ctx,
+    get_confluence_fetcher,
+    peek_confluence_config,
+)
 from mcp_atlassian.utils.decorators import (
     check_write_access,
 )
+from mcp_atlassian.utils.env import is_env_truthy
 from mcp_atlassian.utils.media import (
     ATTACHMENT_MAX_BYTES,
     fetch_and_encode_attachment,
     is_image_attachment,
 )
+from mcp_atlassian.utils.tool_cache import ToolResultCache
+from mcp_atlassian.utils.tools import should_include_tool
+from mcp_atlassian.utils.toolsets import should_include_tool_by_toolset
 from mcp_atlassian.utils.urls import resolve_relative_url
 
 logger = logging.getLogger(__name__)
 
+# Operators and keywords whose presence marks a search query as CQL rather
+# than a simple search term.
+_CQL_HINTS = ("=", "~", ">", "<", " AND ", " OR ", "currentUser()")
+_USER_CQL_HINTS = ("=", "~", ">", "<", " AND ", " OR ", "user.")
+
+
+def _looks_like_cql(query: str, hints: tuple[str, ...] = _CQL_HINTS) -> bool:
+    """Return True if query contains any of the given CQL hints.
+
+    Each hint is a plain substring test, which CPython runs as a C-level
+    fast search; for typical queries this is several times quicker than a
+    single alternation regex over the same literals.
+    """
+    for hint in hints:
+        if hint in query:
+            return True
+    return False
+
+
+# Deployments (keyed by base URL) known to reject siteSearch CQL with a 400,
+# typically older Server/Data Center versions. Simple search terms go straight
+# to text search there instead of paying for a failing request every time.
+_SITE_SEARCH_SUPPORTED: dict[str, bool] = {}
+
+# Tool responses are consumed by LLMs, so they are compact by default.
+# Set MCP_PRETTY_JSON=true to indent them for debugging.
+_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | (
+    orjson.OPT_INDENT_2 if is_env_truthy("MCP_PRETTY_JSON") else 0
+)
+
+
+def _simplify(obj: Any) -> Any:
+    """Serialize API models (anything with to_simplified_dict) for orjson.
+
+    Lets lists of models be passed to _dumps() directly, so they are converted
+    during the single encoder pass instead of via an intermediate list.
+    Exceptions are serialized as their message.
+    """
+    if isinstance(obj, BaseException):
+        return str(obj)
+    to_simplified_dict = getattr(obj, "to_simplified_dict", None)
+    if to_simplified_dict is None:
+        raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+    return to_simplified_dict()
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a tool response to a JSON string."""
+    return orjson.dumps(obj, default=_simplify, option=_JSON_OPTIONS).decode()
+
+
+def _ok(message: str, **extra: Any) -> dict[str, Any]:
+    """Build a success response for a write tool."""
+    return {"success": True, "message": message, **extra}
+
+
+def _fail(message: str, error: Exception | str | None = None) -> dict[str, Any]:
+    """Build a failure response, with the error detail if there is one."""
+    response: dict[str, Any] = {"success": False, "message": message}
+    if error is not None:
+        response["error"] = error
+    return response
+
+
+class _UncacheableResponse(str):
+    """A serialized tool response that _cached_read must not store.
+
+    Used for error payloads and for responses where part of the data could
+    not be fetched, so a retry after a transient failure reaches Confluence
+    again instead of replaying the incomplete response.
+    """
+
+
+# Fixed error responses, serialized once instead of on every failing call
+_PAGE_NOT_FOUND_RESPONSE = _UncacheableResponse(
+    _dumps({"error": "Page not found with the provided identifiers."})
+)
+
+
+# content_format -> (is_markdown, content_representation). Markdown is
+# converted to storage by the fetcher; wiki and storage are passed through.
+_CONTENT_FORMATS: dict[str, tuple[bool, str | None]] = {
+    "markdown": (True, None),
+    "wiki": (False, "wiki"),
+    "storage": (False, "storage"),
+}
+
+
+def _resolve_content_format(content_format: str) -> tuple[bool, str | None]:
+    """Map a page content_format to fetcher arguments.
+
+    Args:
+        content_format: One of 'markdown', 'wiki' or 'storage'.
+
+    Returns:
+        Tuple of (is_markdown, content_representation).
+
+    Raises:
+        ValueError: If content_format is not supported.
+    """
+    try:
+        return _CONTENT_FORMATS[content_format]
+    except KeyError:
+        raise ValueError(
+            f"Invalid content_format: {content_format}. "
+            "Must be 'markdown', 'wiki', or 'storage'"
+        ) from None
+
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+# Responses of read-only tools, reused for identical calls by the same user
+# for a short time. Cleared whenever a Confluence write tool runs.
+_read_cache = ToolResultCache(maxsize=256, ttl=30)
+
+
+def _cached_read(func: F) -> F:
+    """Serve repeated identical calls of a read-only tool from the cache.
+
+    The key combines the tool name, the fully bound arguments and the
+    fetcher config (URL and credentials), so users never share entries.
+    """
+    signature = inspect.signature(func)
+    tool_name = func.__name__
+
+    @wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = dict(bound.arguments)
+        ctx = arguments.pop("ctx")
+        # Avoid building a fetcher just for the key: a cache hit needs none
+        config = peek_confluence_config(ctx)
+        if config is None:
+            config = (await get_confluence_fetcher(ctx)).config
+        key = _read_cache.make_key(tool_name, repr(config), arguments)
+        return await _read_cache.get_or_compute(
+            key,
+            lambda: func(*args, **kwargs),
+            cacheable=lambda result: not isinstance(result, _UncacheableResponse),
+        )
+
+    return wrapper  # type: ignore
+
+
+def _invalidates_read_cache(func: F) -> F:
+    """Clear the read cache after a write tool runs, successful or not."""
+
+    @wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            _read_cache.clear()
+
+    return wrapper  # type: ignore
+
+
+# Long or repeated tool parameter definitions, built once at module scope
+# and referenced from the tool signatures.
+_SEARCH_QUERY_DESCRIPTION = (
+    "Search query - can be either a simple text (e.g. 'project documentation') or a CQL query string. "
+    "Simple queries use 'siteSearch' by default, to mimic the WebUI search, with an automatic fallback "
+    "to 'text' search if not supported. Examples of CQL:\n"
+    "- Basic search: 'type=page AND space=DEV'\n"
+    "- Personal space search: 'space=\"~username\"' (note: personal space keys starting with ~ must be quoted)\n"
+    "- Search by title: 'title~\"Meeting Notes\"'\n"
+    "- Use siteSearch: 'siteSearch ~ \"important concept\"'\n"
+    "- Use text search: 'text ~ \"important concept\"'\n"
+    "- Recent content: 'created >= \"2023-01-01\"'\n"
+    "- Content with specific label: 'label=documentation'\n"
+    "- Recently modified content: 'lastModified > startOfMonth(\"-1M\")'\n"
+    "- Content modified this year: 'creator = currentUser() AND lastModified > startOfYear()'\n"
+    "- Content you contributed to recently: 'contributor = currentUser() AND lastModified > startOfWeek()'\n"
+    "- Content watched by user: 'watcher = \"user@domain.com\" AND type = page'\n"
+    '- Exact phrase in content: \'text ~ "\\"Urgent Review Required\\"" AND label = "pending-approval"\'\n'
+    '- Title wildcards: \'title ~ "Minutes*" AND (space = "HR" OR space = "Marketing")\'\n'
+    'Note: Special identifiers need proper quoting in CQL: personal space keys (e.g., "~username"), '
+    "reserved words, numeric IDs, and identifiers with special characters."
+)
+_SEARCH_QUERY_FIELD = Field(description=_SEARCH_QUERY_DESCRIPTION)
+_PAGE_CONTENT_FORMAT_FIELD = Field(
+    description=(
+        "(Optional) The format of the content parameter. Options: 'markdown' "
+        "(default), 'wiki', or 'storage'. Wiki format uses Confluence wiki "
+        "markup syntax. Choose 'storage' when embedded macros, Jira cards/lists, "
+        "task metadata, or page layout must round-trip unchanged."
+    ),
+    default="markdown",
+)
+_HEADING_ANCHORS_FIELD = Field(
+    description="(Optional) Whether to enable automatic heading anchor generation. Only applies when content_format is 'markdown'",
+    default=False,
+)
+_PAGE_EMOJI_FIELD = Field(
+    description="(Optional) Page title emoji (icon shown in navigation). Can be any emoji character like '📝', '🚀', '📚'. Set to null/None to remove.",
+    default=None,
+)
+_TABLE_LAYOUT_FIELD = Field(
+    description="(Optional) Table width preset applied to all markdown tables. Options: 'full-width' (1800 px), 'wide' (960 px), 'default' (760 px). Only applies when content_format is 'markdown'.",
+    default=None,
+)
+
+
+def _opt_str(value: Any) -> str | None:
+    """Coerce numeric IDs to str, leaving None and strings untouched."""
+    if value is None or isinstance(value, str):
+        return value
+    return str(value)
+
+
+# Shared by every ID parameter that clients may send as a JSON number
+_OPT_STR = BeforeValidator(_opt_str)
+
 
 confluence_mcp = FastMCP(
     name="Confluence MCP Service",
@@ -36,33 +266,10 @@ confluence_mcp = FastMCP(
     tags={"confluence", "read", "toolset:confluence_pages"},
     annotations={"title": "Search Content", "readOnlyHint": True},
 )
+@_cached_read
 async def search(
     ctx: Context,
-    query: Annotated[
-        str,
-        Field(
-            description=(
-                "Search query - can be either a simple text (e.g. 'project documentation') or a CQL query string. "
-                "Simple queries use 'siteSearch' by default, to mimic the WebUI search, with an automatic fallback "
-                "to 'text' search if not supported. Examples of CQL:\n"
-                "- Basic search: 'type=page AND space=DEV'\n"
-                "- Personal space search: 'space=\"~username\"' (note: personal space keys starting with ~ must be quoted)\n"
-                "- Search by title: 'title~\"Meeting Notes\"'\n"
-                "- Use siteSearch: 'siteSearch ~ \"important concept\"'\n"
-                "- Use text search: 'text ~ \"important concept\"'\n"
-                "- Recent content: 'created >= \"2023-01-01\"'\n"
-                "- Content with specific label: 'label=documentation'\n"
-                "- Recently modified content: 'lastModified > startOfMonth(\"-1M\")'\n"
-                "- Content modified this year: 'creator = currentUser() AND lastModified > startOfYear()'\n"
-                "- Content you contributed to recently: 'contributor = currentUser() AND lastModified > startOfWeek()'\n"
-                "- Content watched by user: 'watcher = \"user@domain.com\" AND type = page'\n"
-                '- Exact phrase in content: \'text ~ "\\"Urgent Review Required\\"" AND label = "pending-approval"\'\n'
-                '- Title wildcards: \'title ~ "Minutes*" AND (space = "HR" OR space = "Marketing")\'\n'
-                'Note: Special identifiers need proper quoting in CQL: personal space keys (e.g., "~username"), '
-                "reserved words, numeric IDs, and identifiers with special characters."
-            )
-        ),
-    ],
+    query: Annotated[str, _SEARCH_QUERY_FIELD],
     limit: Annotated[
         int,
         Field(
@@ -97,37 +304,54 @@ async def search(
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
     # Check if the query is a simple search term or already a CQL query
-    if query and not any(
-        x in query for x in ["=", "~", ">", "<", " AND ", " OR ", "currentUser()"]
-    ):
+    if query and not _looks_like_cql(query):
         original_query = query
-        try:
-            query = f'siteSearch ~ "{original_query}"'
+        site_url = confluence_fetcher.config.url
+        pages = None
+        site_search_rejected = False
+        if _SITE_SEARCH_SUPPORTED.get(site_url, True):
+            query = f"siteSearch ~ {quote_cql_string(original_query)}"
             logger.info(
-                f"Converting simple search term to CQL using siteSearch: {query}"
-            )
-            pages = confluence_fetcher.search(
-                query, limit=limit, spaces_filter=spaces_filter
+                "Converting simple search term to CQL using siteSearch: %s", query
             )
-        except Exception as e:
-            logger.warning(f"siteSearch failed ('{e}'), falling back to text search.")
-            query = f'text ~ "{original_query}"'
-            logger.info(f"Falling back to text search with CQL: {query}")
+            try:
+                pages = confluence_fetcher.search(
+                    query, limit=limit, spaces_filter=spaces_filter
+                )
+            except Exception as e:
+                logger.warning(
+                    "siteSearch failed ('%s'), falling back to text search.", e
+                )
+                site_search_rejected = (
+                    isinstance(e, HTTPError)
+                    and e.response is not None
+                    and e.response.status_code == 400
+                )
+        if pages is None:
+            query = f"text ~ {quote_cql_string(original_query)}"
+            logger.info("Falling back to text search with CQL: %s", query)
             pages = confluence_fetcher.search(
                 query, limit=limit, spaces_filter=spaces_filter
             )
+            if site_search_rejected:
+                # The same term worked with text ~, so the 400 came from
+                # siteSearch itself rather than from the search term.
+                logger.info(
+                    "siteSearch is not supported by %s, using text search", site_url
+                )
+                _SITE_SEARCH_SUPPORTED[site_url] = False
     else:
         pages = confluence_fetcher.search(
             query, limit=limit, spaces_filter=spaces_filter
         )
-    search_results = [page.to_simplified_dict() for page in pages]
-    return json.dumps(search_results, indent=2, ensure_ascii=False)
+    return _dumps(pages)
 
 
 @confluence_mcp.tool(
     tags={"confluence", "read", "toolset:confluence_pages"},
     annotations={"title": "Get Page", "readOnlyHint": True},
 )
+@_cached_read
 async def get_page(
     ctx: Context,
     page_id: Annotated[
@@ -141,7 +365,7 @@ async def get_page(
             ),
             default=None,
         ),
-        BeforeValidator(lambda x: str(x) if x is not None else None),
+        _OPT_STR,
     ] = None,
     title: Annotated[
         str | None,
@@ -179,6 +403,16 @@ async def get_page(
             default=True,
         ),
     ] = True,
+    include_content: Annotated[
+        bool,
+        Field(
+            description=(
+                "Whether to include the page body in the response. Set to false "
+                "together with include_metadata to fetch only page metadata."
+            ),
+            default=True,
+        ),
+    ] = True,
     include: Annotated[
         str | None,
         Field(
@@ -200,6 +434,7 @@ async def get_page(
         space_key: The key of the space. Must be used with 'title'.
         include_metadata: Whether to include page metadata.
         convert_to_markdown: Convert content to markdown (true) or keep raw HTML (false).
+        include_content: Whether to include the page body.
         include: Comma-separated enrichments to inline (comments, labels, views, properties).
 
     Returns:
@@ -215,28 +450,25 @@ async def get_page(
                 "page_id was provided; title and space_key parameters will be ignored."
             )
         try:
-            page_id_str = str(page_id)
             page_object = confluence_fetcher.get_page_content(
-                page_id_str, convert_to_markdown=convert_to_markdown
+                page_id, convert_to_markdown=convert_to_markdown
             )
         except Exception as e:
-            logger.error(f"Error fetching page by ID '{page_id}': {e}")
-            return json.dumps(
-                {"error": f"Failed to retrieve page by ID '{page_id}': {e}"},
-                indent=2,
-                ensure_ascii=False,
+            logger.error("Error fetching page by ID '%s': %s", page_id, e)
+            return _UncacheableResponse(
+                _dumps({"error": f"Failed to retrieve page by ID '{page_id}': {e}"})
             )
     elif title and space_key:
         page_object = confluence_fetcher.get_page_by_title(
             space_key, title, convert_to_markdown=convert_to_markdown
         )
         if not page_object:
-            return json.dumps(
-                {
-                    "error": f"Page with title '{title}' not found in space '{space_key}'."
-                },
-                indent=2,
-                ensure_ascii=False,
+            return _UncacheableResponse(
+                _dumps(
+                    {
+                        "error": f"Page with title '{title}' not found in space '{space_key}'."
+                    }
+                )
             )
     else:
         raise ValueError(
@@ -244,19 +476,23 @@ async def get_page(
         )
 
     if not page_object:
-        return json.dumps(
-            {"error": "Page not found with the provided identifiers."},
-            indent=2,
-            ensure_ascii=False,
-        )
+        return _PAGE_NOT_FOUND_RESPONSE
 
     result: dict
     if include_metadata:
-        result = {"metadata": page_object.to_simplified_dict()}
-    else:
+        result = {
+            "metadata": page_object.to_simplified_dict()
+            if include_content
+            else page_object.to_metadata_dict()
+        }
+    elif include_content:
         result = {"content": {"value": page_object.content}}
+    else:
+        result = {}
 
-    # Inline requested enrichments to avoid extra tool calls
+    # Inline requested enrichments to avoid extra tool calls. A failed
+    # enrichment degrades to an empty value, which must not be cached.
+    degraded = False
     if include:
         sections = {s.strip().lower() for s in include.split(",")}
         resolved_page_id = str(page_object.id)
@@ -275,6 +511,7 @@ async def get_page(
                     resolved_page_id,
                 )
                 result["comments"] = []
+                degraded = True
 
         if "labels" in sections:
             try:
@@ -286,6 +523,7 @@ async def get_page(
                     resolved_page_id,
                 )
                 result["labels"] = []
+                degraded = True
 
         if "views" in sections:
             try:
@@ -311,8 +549,10 @@ async def get_page(
                     resolved_page_id,
                 )
                 result["properties"] = {}
+                degraded = True
 
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    response = _dumps(result)
+    return _UncacheableResponse(response) if degraded else response
 
 
 @confluence_mcp.tool(
@@ -397,28 +637,30 @@ async def get_page_children(
             convert_to_markdown=convert_to_markdown,
             include_folders=include_folders,
         )
-        child_pages = [page.to_simplified_dict() for page in pages]
-        result = {
-            "parent_id": parent_id,
-            "count": len(child_pages),
-            "limit_requested": limit,
-            "start_requested": start,
-            "results": child_pages,
-        }
+        return _dumps(
+            {
+                "parent_id": parent_id,
+                "count": len(pages),
+                "limit_requested": limit,
+                "start_requested": start,
+                "results": pages,
+            }
+        )
     except Exception as e:
         logger.error(
-            f"Error getting/processing children for page ID {parent_id}: {e}",
+            "Error getting/processing children for page ID %s: %s",
+            parent_id,
+            e,
             exc_info=True,
         )
-        result = {"error": f"Failed to get child pages: {e}"}
-
-    return json.dumps(result, indent=2, ensure_ascii=False)
+        return _dumps({"error": f"Failed to get child pages: {e}"})
 
 
 @confluence_mcp.tool(
     tags={"confluence", "read", "toolset:confluence_pages"},
     annotations={"title": "Get Space Page Tree", "readOnlyHint": True},
 )
+@_cached_read
 async def get_space_page_tree(
     ctx: Context,
     space_key: Annotated[
@@ -464,7 +706,7 @@ async def get_space_page_tree(
             f"Results truncated at {limit} pages. Increase limit to see more."
         )
 
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return _dumps(result)
 
 
 @confluence_mcp.tool(
@@ -495,14 +737,14 @@ async def get_comments(
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
     comments = confluence_fetcher.get_page_comments(page_id)
-    formatted_comments = [comment.to_simplified_dict() for comment in comments]
-    return json.dumps(formatted_comments, indent=2, ensure_ascii=False)
+    return _dumps(comments)
 
 
 @confluence_mcp.tool(
     tags={"confluence", "read", "toolset:confluence_labels"},
     annotations={"title": "Get Labels", "readOnlyHint": True},
 )
+@_cached_read
 async def get_labels(
     ctx: Context,
     page_id: Annotated[
@@ -528,8 +770,7 @@ async def get_labels(
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
     labels = confluence_fetcher.get_page_labels(page_id)
-    formatted_labels = [label.to_simplified_dict() for label in labels]
-    return json.dumps(formatted_labels, indent=2, ensure_ascii=False)
+    return _dumps(labels)
 
 
 @confluence_mcp.tool(
@@ -537,6 +778,7 @@ async def get_labels(
     annotations={"title": "Add Label", "destructiveHint": True},
 )
 @check_write_access
+@_invalidates_read_cache
 async def add_label(
     ctx: Context,
     page_id: Annotated[
@@ -581,8 +823,7 @@ async def add_label(
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
     labels = confluence_fetcher.add_page_label(page_id, name)
-    formatted_labels = [label.to_simplified_dict() for label in labels]
-    return json.dumps(formatted_labels, indent=2, ensure_ascii=False)
+    return _dumps(labels)
 
 
 @confluence_mcp.tool(
@@ -590,6 +831,7 @@ async def add_label(
     annotations={"title": "Create Page", "destructiveHint": True},
 )
 @check_write_access
+@_invalidates_read_cache
 async def create_page(
     ctx: Context,
     space_key: Annotated[
@@ -615,27 +857,10 @@ async def create_page(
             description="(Optional) parent page ID. If provided, this page will be created as a child of the specified page",
             default=None,
         ),
-        BeforeValidator(lambda x: str(x) if x is not None else None),
+        _OPT_STR,
     ] = None,
-    content_format: Annotated[
-        str,
-        Field(
-            description=(
-                "(Optional) The format of the content parameter. Options: 'markdown' "
-                "(default), 'wiki', or 'storage'. Wiki format uses Confluence wiki "
-                "markup syntax. Choose 'storage' when embedded macros, Jira cards/lists, "
-                "task metadata, or page layout must round-trip unchanged."
-            ),
-            default="markdown",
-        ),
-    ] = "markdown",
-    enable_heading_anchors: Annotated[
-        bool,
-        Field(
-            description="(Optional) Whether to enable automatic heading anchor generation. Only applies when content_format is 'markdown'",
-            default=False,
-        ),
-    ] = False,
+    content_format: Annotated[str, _PAGE_CONTENT_FORMAT_FIELD] = "markdown",
+    enable_heading_anchors: Annotated[bool, _HEADING_ANCHORS_FIELD] = False,
     include_content: Annotated[
         bool,
         Field(
@@ -643,13 +868,7 @@ async def create_page(
             default=False,
         ),
     ] = False,
-    emoji: Annotated[
-        str | None,
-        Field(
-            description="(Optional) Page title emoji (icon shown in navigation). Can be any emoji character like '📝', '🚀', '📚'. Set to null/None to remove.",
-            default=None,
-        ),
-    ] = None,
+    emoji: Annotated[str | None, _PAGE_EMOJI_FIELD] = None,
     page_width: Annotated[
         str | None,
         Field(
@@ -657,13 +876,7 @@ async def create_page(
             default=None,
         ),
     ] = None,
-    table_layout: Annotated[
-        str | None,
-        Field(
-            description="(Optional) Table width preset applied to all markdown tables. Options: 'full-width' (1800 px), 'wide' (960 px), 'default' (760 px). Only applies when content_format is 'markdown'.",
-            default=None,
-        ),
-    ] = None,
+    table_layout: Annotated[str | None, _TABLE_LAYOUT_FIELD] = None,
 ) -> str:
     """Create a new Confluence page.
 
@@ -688,19 +901,7 @@ async def create_page(
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
 
-    # Validate content_format
-    if content_format not in ["markdown", "wiki", "storage"]:
-        raise ValueError(
-            f"Invalid content_format: {content_format}. Must be 'markdown', 'wiki', or 'storage'"
-        )
-
-    # Determine parameters based on content format
-    if content_format == "markdown":
-        is_markdown = True
-        content_representation = None  # Will be converted to storage
-    else:
-        is_markdown = False
-        content_representation = content_format  # Pass 'wiki' or 'storage' directly
+    is_markdown, content_representation = _resolve_content_format(content_format)
 
     page = confluence_fetcher.create_page(
         space_key=space_key,
@@ -708,22 +909,14 @@ async def create_page(
         body=content,
         parent_id=parent_id,
         is_markdown=is_markdown,
-        enable_heading_anchors=enable_heading_anchors
-        if content_format == "markdown"
-        else False,
+        enable_heading_anchors=enable_heading_anchors and is_markdown,
         content_representation=content_representation,
         emoji=emoji,
         page_width=page_width,
-        table_layout=table_layout if content_format == "markdown" else None,
-    )
-    result = page.to_simplified_dict()
-    if not include_content:
-        result.pop("content", None)
-    return json.dumps(
-        {"message": "Page created successfully", "page": result},
-        indent=2,
-        ensure_ascii=False,
+        table_layout=table_layout if is_markdown else None,
     )
+    result = page.to_simplified_dict() if include_content else page.to_metadata_dict()
+    return _dumps({"message": "Page created successfully", "page": result})
 
 
 @confluence_mcp.tool(
@@ -731,6 +924,7 @@ async def create_page(
     annotations={"title": "Update Page", "destructiveHint": True},
 )
 @check_write_access
+@_invalidates_read_cache
 async def update_page(
     ctx: Context,
     page_id: Annotated[str, Field(description="The ID of the page to update")],
@@ -754,27 +948,10 @@ async def update_page(
     parent_id: Annotated[
         str | None,
         Field(description="Optional the new parent page ID", default=None),
-        BeforeValidator(lambda x: str(x) if x is not None else None),
+        _OPT_STR,
     ] = None,
-    content_format: Annotated[
-        str,
-        Field(
-            description=(
-                "(Optional) The format of the content parameter. Options: 'markdown' "
-                "(default), 'wiki', or 'storage'. Wiki format uses Confluence wiki "
-                "markup syntax. Choose 'storage' when embedded macros, Jira cards/lists, "
-                "task metadata, or page layout must round-trip unchanged."
-            ),
-            default="markdown",
-        ),
-    ] = "markdown",
-    enable_heading_anchors: Annotated[
-        bool,
-        Field(
-            description="(Optional) Whether to enable automatic heading anchor generation. Only applies when content_format is 'markdown'",
-            default=False,
-        ),
-    ] = False,
+    content_format: Annotated[str, _PAGE_CONTENT_FORMAT_FIELD] = "markdown",
+    enable_heading_anchors: Annotated[bool, _HEADING_ANCHORS_FIELD] = False,
     include_content: Annotated[
         bool,
         Field(
@@ -782,13 +959,7 @@ async def update_page(
             default=False,
         ),
     ] = False,
-    emoji: Annotated[
-        str | None,
-        Field(
-            description="(Optional) Page title emoji (icon shown in navigation). Can be any emoji character like '📝', '🚀', '📚'. Set to null/None to remove.",
-            default=None,
-        ),
-    ] = None,
+    emoji: Annotated[str | None, _PAGE_EMOJI_FIELD] = None,
     page_width: Annotated[
         str | None,
         Field(
@@ -796,13 +967,7 @@ async def update_page(
             default=None,
         ),
     ] = None,
-    table_layout: Annotated[
-        str | None,
-        Field(
-            description="(Optional) Table width preset applied to all markdown tables. Options: 'full-width' (1800 px), 'wide' (960 px), 'default' (760 px). Only applies when content_format is 'markdown'.",
-            default=None,
-        ),
-    ] = None,
+    table_layout: Annotated[str | None, _TABLE_LAYOUT_FIELD] = None,
 ) -> str:
     """Update an existing Confluence page.
 
@@ -829,19 +994,7 @@ async def update_page(
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
 
-    # Validate content_format
-    if content_format not in ["markdown", "wiki", "storage"]:
-        raise ValueError(
-            f"Invalid content_format: {content_format}. Must be 'markdown', 'wiki', or 'storage'"
-        )
-
-    # Determine parameters based on content format
-    if content_format == "markdown":
-        is_markdown = True
-        content_representation = None  # Will be converted to storage
-    else:
-        is_markdown = False
-        content_representation = content_format  # Pass 'wiki' or 'storage' directly
+    is_markdown, content_representation = _resolve_content_format(content_format)
 
     updated_page = confluence_fetcher.update_page(
         page_id=page_id,
@@ -851,22 +1004,18 @@ async def update_page(
         version_comment=version_comment,
         is_markdown=is_markdown,
         parent_id=parent_id,
-        enable_heading_anchors=enable_heading_anchors
-        if content_format == "markdown"
-        else False,
+        enable_heading_anchors=enable_heading_anchors and is_markdown,
         content_representation=content_representation,
         emoji=emoji,
         page_width=page_width,
-        table_layout=table_layout if content_format == "markdown" else None,
+        table_layout=table_layout if is_markdown else None,
     )
-    page_data = updated_page.to_simplified_dict()
-    if not include_content:
-        page_data.pop("content", None)
-    return json.dumps(
-        {"message": "Page updated successfully", "page": page_data},
-        indent=2,
-        ensure_ascii=False,
+    page_data = (
+        updated_page.to_simplified_dict()
+        if include_content
+        else updated_page.to_metadata_dict()
     )
+    return _dumps({"message": "Page updated successfully", "page": page_data})
 
 
 @confluence_mcp.tool(
@@ -874,6 +1023,7 @@ async def update_page(
     annotations={"title": "Update Page Section", "destructiveHint": True},
 )
 @check_write_access
+@_invalidates_read_cache
 async def update_page_section(
     ctx: Context,
     page_id: Annotated[str, Field(description="The ID of the page to update")],
@@ -941,7 +1091,7 @@ async def update_page_section(
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
 
-    if content_format not in ("markdown", "storage"):
+    if content_format not in SECTION_CONTENT_FORMATS:
         raise ValueError(
             f"Invalid content_format '{content_format}'. Must be 'markdown' or 'storage'."
         )
@@ -955,15 +1105,12 @@ async def update_page_section(
         version_comment=version_comment or "",
     )
 
-    page_data = updated_page.to_simplified_dict()
-    page_data.pop("content", None)
-    return json.dumps(
+    page_data = updated_page.to_metadata_dict()
+    return _dumps(
         {
             "message": f"Section '{heading_text}' updated successfully",
             "page": page_data,
-        },
-        indent=2,
-        ensure_ascii=False,
+        }
     )
 
 
@@ -972,6 +1119,7 @@ async def update_page_section(
     annotations={"title": "Delete Page", "destructiveHint": True},
 )
 @check_write_access
+@_invalidates_read_cache
 async def delete_page(
     ctx: Context,
     page_id: Annotated[str, Field(description="The ID of the page to delete")],
@@ -992,24 +1140,16 @@ async def delete_page(
     try:
         result = confluence_fetcher.delete_page(page_id=page_id)
         if result:
-            response = {
-                "success": True,
-                "message": f"Page {page_id} deleted successfully",
-            }
+            response = _ok(f"Page {page_id} deleted successfully")
         else:
-            response = {
-                "success": False,
-                "message": f"Unable to delete page {page_id}. API request completed but deletion unsuccessful.",
-            }
+            response = _fail(
+                f"Unable to delete page {page_id}. API request completed but deletion unsuccessful."
+            )
     except Exception as e:
-        logger.error(f"Error deleting Confluence page {page_id}: {str(e)}")
-        response = {
-            "success": False,
-            "message": f"Error deleting page {page_id}",
-            "error": str(e),
-        }
+        logger.error("Error deleting Confluence page %s: %s", page_id, e)
+        response = _fail(f"Error deleting page {page_id}", e)
 
-    return json.dumps(response, indent=2, ensure_ascii=False)
+    return _dumps(response)
 
 
 @confluence_mcp.tool(
@@ -1017,6 +1157,7 @@ async def delete_page(
     annotations={"title": "Move Page", "destructiveHint": True},
 )
 @check_write_access
+@_invalidates_read_cache
 async def move_page(
     ctx: Context,
     page_id: Annotated[str, Field(description="ID of the page to move")],
@@ -1074,21 +1215,12 @@ async def move_page(
             position=position,
         )
         page_data = moved_page.to_simplified_dict()
-        return json.dumps(
-            {"message": "Page moved successfully", "page": page_data},
-            indent=2,
-            ensure_ascii=False,
-        )
+        return _dumps({"message": "Page moved successfully", "page": page_data})
     except ValueError:
         raise
     except Exception as e:
-        logger.error(f"Error moving Confluence page {page_id}: {str(e)}")
-        response = {
-            "success": False,
-            "message": f"Error moving page {page_id}",
-            "error": str(e),
-        }
-        return json.dumps(response, indent=2, ensure_ascii=False)
+        logger.error("Error moving Confluence page %s: %s", page_id, e)
+        return _dumps(_fail(f"Error moving page {page_id}", e))
 
 
 @confluence_mcp.tool(
@@ -1096,6 +1228,7 @@ async def move_page(
     annotations={"title": "Add Comment", "destructiveHint": True},
 )
 @check_write_access
+@_invalidates_read_cache
 async def add_comment(
     ctx: Context,
     page_id: Annotated[
@@ -1120,26 +1253,18 @@ async def add_comment(
     try:
         comment = confluence_fetcher.add_comment(page_id=page_id, content=body)
         if comment:
-            comment_data = comment.to_simplified_dict()
-            response = {
-                "success": True,
-                "message": "Comment added successfully",
-                "comment": comment_data,
-            }
+            response = _ok(
+                "Comment added successfully", comment=comment.to_simplified_dict()
+            )
         else:
-            response = {
-                "success": False,
-                "message": f"Unable to add comment to page {page_id}. API request completed but comment creation unsuccessful.",
-            }
+            response = _fail(
+                f"Unable to add comment to page {page_id}. API request completed but comment creation unsuccessful."
+            )
     except Exception as e:
-        logger.error(f"Error adding comment to Confluence page {page_id}: {str(e)}")
-        response = {
-            "success": False,
-            "message": f"Error adding comment to page {page_id}",
-            "error": str(e),
-        }
+        logger.error("Error adding comment to Confluence page %s: %s", page_id, e)
+        response = _fail(f"Error adding comment to page {page_id}", e)
 
-    return json.dumps(response, indent=2, ensure_ascii=False)
+    return _dumps(response)
 
 
 @confluence_mcp.tool(
@@ -1147,6 +1272,7 @@ async def add_comment(
     annotations={"title": "Reply to Comment", "destructiveHint": True},
 )
 @check_write_access
+@_invalidates_read_cache
 async def reply_to_comment(
     ctx: Context,
     comment_id: Annotated[
@@ -1173,26 +1299,18 @@ async def reply_to_comment(
             comment_id=comment_id, content=body
         )
         if comment:
-            comment_data = comment.to_simplified_dict()
-            response = {
-                "success": True,
-                "message": "Reply added successfully",
-                "comment": comment_data,
-            }
+            response = _ok(
+                "Reply added successfully", comment=comment.to_simplified_dict()
+            )
         else:
-            response = {
-                "success": False,
-                "message": f"Unable to reply to comment {comment_id}. API request completed but reply creation unsuccessful.",
-            }
+            response = _fail(
+                f"Unable to reply to comment {comment_id}. API request completed but reply creation unsuccessful."
+            )
     except Exception as e:
-        logger.error(f"Error replying to comment {comment_id}: {str(e)}")
-        response = {
-            "success": False,
-            "message": f"Error replying to comment {comment_id}",
-            "error": str(e),
-        }
+        logger.error("Error replying to comment %s: %s", comment_id, e)
+        response = _fail(f"Error replying to comment {comment_id}", e)
 
-    return json.dumps(response, indent=2, ensure_ascii=False)
+    return _dumps(response)
 
 
 @confluence_mcp.tool(
@@ -1220,23 +1338,19 @@ async def get_inline_comments(
     confluence_fetcher = await get_confluence_fetcher(ctx)
     try:
         comments = confluence_fetcher.get_inline_comments(page_id)
-        response = {
-            "success": True,
-            "page_id": page_id,
-            "count": len(comments),
-            "comments": [c.to_simplified_dict() for c in comments],
-        }
+        return _dumps(
+            {
+                "success": True,
+                "page_id": page_id,
+                "count": len(comments),
+                "comments": comments,
+            }
+        )
     except Exception as e:
         logger.error(
-            f"Error getting inline comments for Confluence page {page_id}: {str(e)}"
+            "Error getting inline comments for Confluence page %s: %s", page_id, e
         )
-        response = {
-            "success": False,
-            "message": f"Error getting inline comments for page {page_id}",
-            "error": str(e),
-        }
-
-    return json.dumps(response, indent=2, ensure_ascii=False)
+        return _dumps(_fail(f"Error getting inline comments for page {page_id}", e))
 
 
 @confluence_mcp.tool(
@@ -1244,6 +1358,7 @@ async def get_inline_comments(
     annotations={"title": "Add Inline Comment", "destructiveHint": True},
 )
 @check_write_access
+@_invalidates_read_cache
 async def add_inline_comment(
     ctx: Context,
     page_id: Annotated[
@@ -1306,30 +1421,22 @@ async def add_inline_comment(
             text_selection_match_index=text_selection_match_index,
         )
         if comment:
-            response = {
-                "success": True,
-                "message": "Inline comment added successfully",
-                "comment": comment.to_simplified_dict(),
-            }
+            response = _ok(
+                "Inline comment added successfully",
+                comment=comment.to_simplified_dict(),
+            )
         else:
-            response = {
-                "success": False,
-                "message": (
-                    f"Unable to add inline comment to page {page_id}. "
-                    "API request completed but comment creation unsuccessful."
-                ),
-            }
+            response = _fail(
+                f"Unable to add inline comment to page {page_id}. "
+                "API request completed but comment creation unsuccessful."
+            )
     except Exception as e:
         logger.error(
-            f"Error adding inline comment to Confluence page {page_id}: {str(e)}"
+            "Error adding inline comment to Confluence page %s: %s", page_id, e
         )
-        response = {
-            "success": False,
-            "message": f"Error adding inline comment to page {page_id}",
-            "error": str(e),
-        }
+        response = _fail(f"Error adding inline comment to page {page_id}", e)
 
-    return json.dumps(response, indent=2, ensure_ascii=False)
+    return _dumps(response)
 
 
 @confluence_mcp.tool(
@@ -1385,37 +1492,30 @@ async def search_user(
     confluence_fetcher = await get_confluence_fetcher(ctx)
 
     # If the query doesn't look like CQL, wrap it as a user fullname search
-    if query and not any(
-        x in query for x in ["=", "~", ">", "<", " AND ", " OR ", "user."]
-    ):
+    if query and not _looks_like_cql(query, _USER_CQL_HINTS):
         # Simple search term - search by fullname
-        query = f'user.fullname ~ "{query}"'
-        logger.info(f"Converting simple search term to user CQL: {query}")
+        query = f"user.fullname ~ {quote_cql_string(query)}"
+        logger.info("Converting simple search term to user CQL: %s", query)
 
     try:
         user_results = confluence_fetcher.search_user(
             query, limit=limit, group_name=group_name
         )
-        search_results = [user.to_simplified_dict() for user in user_results]
-        return json.dumps(search_results, indent=2, ensure_ascii=False)
+        return _dumps(user_results)
     except MCPAtlassianAuthenticationError as e:
-        logger.error(f"Authentication error during user search: {e}", exc_info=False)
-        return json.dumps(
+        logger.error("Authentication error during user search: %s", e, exc_info=False)
+        return _dumps(
             {
                 "error": "Authentication failed. Please check your credentials.",
-                "details": str(e),
-            },
-            indent=2,
-            ensure_ascii=False,
+                "details": e,
+            }
         )
     except Exception as e:
-        logger.error(f"Error searching users: {str(e)}")
-        return json.dumps(
+        logger.error("Error searching users: %s", e)
+        return _dumps(
             {
                 "error": f"An unexpected error occurred while searching for users: {str(e)}"
-            },
-            indent=2,
-            ensure_ascii=False,
+            }
         )
 
 
@@ -1456,7 +1556,7 @@ async def get_user_details(
     else:
         result = confluence.get_user_details_by_username(identifier)
 
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return _dumps(result)
 
 
 @confluence_mcp.tool(
@@ -1513,29 +1613,25 @@ async def get_page_history(
             convert_to_markdown=convert_to_markdown,
         )
         result = page.to_simplified_dict()
-        return json.dumps(result, indent=2, ensure_ascii=False)
+        return _dumps(result)
     except MCPAtlassianAuthenticationError as e:
-        logger.error(f"Authentication error getting page history: {e}")
-        return json.dumps(
+        logger.error("Authentication error getting page history: %s", e)
+        return _dumps(
             {
                 "error": "Authentication failed. Please check your credentials.",
-                "details": str(e),
-            },
-            indent=2,
-            ensure_ascii=False,
+                "details": e,
+            }
         )
     except Exception as e:
         logger.error(
-            f"Error getting page history for page {page_id} version {version}: {e}"
+            "Error getting page history for page %s version %s: %s", page_id, version, e
         )
-        return json.dumps(
+        return _dumps(
             {
                 "error": f"Failed to get page history: {e}",
                 "page_id": page_id,
                 "version": version,
-            },
-            indent=2,
-            ensure_ascii=False,
+            }
         )
 
 
@@ -1588,31 +1684,30 @@ async def get_page_diff(
             from_version=from_version,
             to_version=to_version,
         )
-        return json.dumps(result, indent=2, ensure_ascii=False)
+        return _dumps(result)
     except MCPAtlassianAuthenticationError as e:
-        logger.error(f"Authentication error getting page diff: {e}")
-        return json.dumps(
+        logger.error("Authentication error getting page diff: %s", e)
+        return _dumps(
             {
                 "error": "Authentication failed. Please check your credentials.",
-                "details": str(e),
-            },
-            indent=2,
-            ensure_ascii=False,
+                "details": e,
+            }
         )
     except Exception as e:
         logger.error(
-            f"Error getting diff for page {page_id} "
-            f"(v{from_version} -> v{to_version}): {e}"
+            "Error getting diff for page %s (v%s -> v%s): %s",
+            page_id,
+            from_version,
+            to_version,
+            e,
         )
-        return json.dumps(
+        return _dumps(
             {
                 "error": f"Failed to get page diff: {e}",
                 "page_id": page_id,
                 "from_version": from_version,
                 "to_version": to_version,
-            },
-            indent=2,
-            ensure_ascii=False,
+            }
         )
 
 
@@ -1656,31 +1751,21 @@ async def get_page_views(
             page_id=page_id,
             include_title=include_title,
         )
-        return json.dumps(result.to_simplified_dict(), indent=2, ensure_ascii=False)
+        return _dumps(result.to_simplified_dict())
     except MCPAtlassianAuthenticationError as e:
-        logger.error(f"Authentication error getting page views: {e}")
-        return json.dumps(
+        logger.error("Authentication error getting page views: %s", e)
+        return _dumps(
             {
                 "error": "Authentication failed. Please check your credentials.",
-                "details": str(e),
-            },
-            indent=2,
-            ensure_ascii=False,
+                "details": e,
+            }
         )
     except ValueError as e:
-        logger.error(f"Error getting page views for {page_id}: {e}")
-        return json.dumps(
-            {"error": str(e), "page_id": page_id},
-            indent=2,
-            ensure_ascii=False,
-        )
+        logger.error("Error getting page views for %s: %s", page_id, e)
+        return _dumps({"error": e, "page_id": page_id})
     except Exception as e:
-        logger.error(f"Unexpected error getting page views for {page_id}: {e}")
-        return json.dumps(
-            {"error": f"Failed to get page views: {e}", "page_id": page_id},
-            indent=2,
-            ensure_ascii=False,
-        )
+        logger.error("Unexpected error getting page views for %s: %s", page_id, e)
+        return _dumps({"error": f"Failed to get page views: {e}", "page_id": page_id})
 
 
 # ===== Attachment Operations =====
@@ -1691,6 +1776,7 @@ async def get_page_views(
     annotations={"title": "Upload Attachment", "destructiveHint": True},
 )
 @check_write_access
+@_invalidates_read_cache
 async def upload_attachment(
     ctx: Context,
     content_id: Annotated[
@@ -1761,11 +1847,7 @@ async def upload_attachment(
         minor_edit=minor_edit,
     )
 
-    return json.dumps(
-        {"message": "Attachment uploaded successfully", "attachment": result},
-        indent=2,
-        ensure_ascii=False,
-    )
+    return _dumps({"message": "Attachment uploaded successfully", "attachment": result})
 
 
 @confluence_mcp.tool(
@@ -1773,6 +1855,7 @@ async def upload_attachment(
     annotations={"title": "Upload Multiple Attachments", "destructiveHint": True},
 )
 @check_write_access
+@_invalidates_read_cache
 async def upload_attachments(
     ctx: Context,
     content_id: Annotated[
@@ -1847,13 +1930,11 @@ async def upload_attachments(
         minor_edit=minor_edit,
     )
 
-    return json.dumps(
+    return _dumps(
         {
             "message": f"Uploaded {len(results)} attachment(s) successfully",
             "attachments": results,
-        },
-        indent=2,
-        ensure_ascii=False,
+        }
     )
 
 
@@ -1959,7 +2040,7 @@ async def get_attachments(
         media_type=media_type,
     )
 
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return _dumps(result)
 
 
 @confluence_mcp.tool(
@@ -2013,15 +2094,13 @@ async def download_attachment(
         if not download_url:
             return TextContent(
                 type="text",
-                text=json.dumps(
+                text=_dumps(
                     {
                         "success": False,
                         "error": (
                             f"Could not find download URL for attachment {attachment_id}"
                         ),
-                    },
-                    indent=2,
-                    ensure_ascii=False,
+                    }
                 ),
             )
 
@@ -2038,7 +2117,7 @@ async def download_attachment(
         if file_size is not None and file_size > ATTACHMENT_MAX_BYTES:
             return TextContent(
                 type="text",
-                text=json.dumps(
+                text=_dumps(
                     {
                         "success": False,
                         "attachment_id": attachment_id,
@@ -2048,9 +2127,7 @@ async def download_attachment(
                             f"Attachment '{filename}' is {file_size} bytes which exceeds "
                             "the 50 MB inline limit. Retrieve it directly from Confluence."
                         ),
-                    },
-                    indent=2,
-                    ensure_ascii=False,
+                    }
                 ),
             )
 
@@ -2058,20 +2135,18 @@ async def download_attachment(
         if data_bytes is None:
             return TextContent(
                 type="text",
-                text=json.dumps(
+                text=_dumps(
                     {
                         "success": False,
                         "error": (f"Failed to download attachment {attachment_id}"),
-                    },
-                    indent=2,
-                    ensure_ascii=False,
+                    }
                 ),
             )
 
         if len(data_bytes) > ATTACHMENT_MAX_BYTES:
             return TextContent(
                 type="text",
-                text=json.dumps(
+                text=_dumps(
                     {
                         "success": False,
                         "attachment_id": attachment_id,
@@ -2082,9 +2157,7 @@ async def download_attachment(
                             "exceeds the 50 MB inline limit. Retrieve it directly from "
                             "Confluence."
                         ),
-                    },
-                    indent=2,
-                    ensure_ascii=False,
+                    }
                 ),
             )
 
@@ -2101,13 +2174,11 @@ async def download_attachment(
     except Exception as e:
         return TextContent(
             type="text",
-            text=json.dumps(
+            text=_dumps(
                 {
                     "success": False,
                     "error": f"Error downloading attachment: {str(e)}",
-                },
-                indent=2,
-                ensure_ascii=False,
+                }
             ),
         )
 
@@ -2153,7 +2224,7 @@ async def download_content_attachments(
         contents.append(
             TextContent(
                 type="text",
-                text=json.dumps(attachments_result, indent=2, ensure_ascii=False),
+                text=_dumps(attachments_result),
             )
         )
         return contents
@@ -2164,16 +2235,14 @@ async def download_content_attachments(
         contents.append(
             TextContent(
                 type="text",
-                text=json.dumps(
+                text=_dumps(
                     {
                         "success": True,
                         "content_id": content_id,
                         "message": f"No attachments found for content {content_id}",
                         "downloaded": 0,
                         "failed": [],
-                    },
-                    indent=2,
-                    ensure_ascii=False,
+                    }
                 ),
             )
         )
@@ -2257,7 +2326,7 @@ async def download_content_attachments(
         0,
         TextContent(
             type="text",
-            text=json.dumps(summary, indent=2, ensure_ascii=False),
+            text=_dumps(summary),
         ),
     )
     return contents
@@ -2268,6 +2337,7 @@ async def download_content_attachments(
     annotations={"title": "Delete Attachment", "destructiveHint": True},
 )
 @check_write_access
+@_invalidates_read_cache
 async def delete_attachment(
     ctx: Context,
     attachment_id: Annotated[
@@ -2307,13 +2377,11 @@ async def delete_attachment(
 
     confluence_fetcher.delete_attachment(attachment_id=attachment_id)
 
-    return json.dumps(
+    return _dumps(
         {
             "message": "Attachment deleted successfully",
             "attachment_id": attachment_id,
-        },
-        indent=2,
-        ensure_ascii=False,
+        }
     )
 
 
@@ -2360,7 +2428,7 @@ async def get_page_images(
         contents.append(
             TextContent(
                 type="text",
-                text=json.dumps(attachments_result, indent=2, ensure_ascii=False),
+                text=_dumps(attachments_result),
             )
         )
         return contents
@@ -2384,7 +2452,7 @@ async def get_page_images(
         contents.append(
             TextContent(
                 type="text",
-                text=json.dumps(
+                text=_dumps(
                     {
                         "success": True,
                         "content_id": content_id,
@@ -2392,9 +2460,7 @@ async def get_page_images(
                         "downloaded": 0,
                         "failed": [],
                         "message": "No image attachments found",
-                    },
-                    indent=2,
-                    ensure_ascii=False,
+                    }
                 ),
             )
         )
@@ -2466,7 +2532,7 @@ async def get_page_images(
         0,
         TextContent(
             type="text",
-            text=json.dumps(summary, indent=2, ensure_ascii=False),
+            text=_dumps(summary),
         ),
     )
     return contents
@@ -2477,6 +2543,7 @@ async def get_page_images(
     annotations={"title": "Set Content Property", "destructiveHint": True},
 )
 @check_write_access
+@_invalidates_read_cache
 async def set_content_property(
     ctx: Context,
     page_id: Annotated[
@@ -2537,6 +2604,8 @@ async def set_content_property(
     Raises:
         ValueError: If the value is not valid JSON or in read-only mode.
     """
+    # Property values are arbitrary user JSON and may hold integers beyond
+    # orjson's 64-bit range, so this tool uses the stdlib json module.
     try:
         parsed_value = json.loads(value)
     except json.JSONDecodeError as exc:
@@ -2547,7 +2616,7 @@ async def set_content_property(
 
     confluence_fetcher = await get_confluence_fetcher(ctx)
     result = confluence_fetcher.set_content_property(page_id, key, parsed_value)
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return json.dumps(result, ensure_ascii=False, separators=(",", ":"))
 
 
 @confluence_mcp.tool(
@@ -2576,7 +2645,7 @@ async def get_page_restrictions(
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
     restrictions = confluence_fetcher.get_page_restrictions(page_id=page_id)
-    return json.dumps(restrictions, indent=2, ensure_ascii=False)
+    return _dumps(restrictions)
 
 
 @confluence_mcp.tool(
@@ -2584,6 +2653,7 @@ async def get_page_restrictions(
     annotations={"title": "Set Page Restrictions", "destructiveHint": True},
 )
 @check_write_access
+@_invalidates_read_cache
 async def set_page_restrictions(
     ctx: Context,
     page_id: Annotated[str, Field(description="The ID of the page to restrict")],
@@ -2643,10 +2713,8 @@ async def set_page_restrictions(
         edit_users=edit_users,
         edit_groups=edit_groups,
     )
-    return json.dumps(
-        {"message": "Page restrictions updated successfully", "restrictions": result},
-        indent=2,
-        ensure_ascii=False,
+    return _dumps(
+        {"message": "Page restrictions updated successfully", "restrictions": result}
     )
 
 
@@ -2655,6 +2723,7 @@ async def set_page_restrictions(
     annotations={"title": "Copy Page", "destructiveHint": True},
 )
 @check_write_access
+@_invalidates_read_cache
 async def copy_page(
     ctx: Context,
     source_page_id: Annotated[str, Field(description="The ID of the page to copy")],
@@ -2669,7 +2738,7 @@ async def copy_page(
             description="(Optional) Parent page ID in the destination space. When omitted the page is created at the space root.",
             default=None,
         ),
-        BeforeValidator(lambda x: str(x) if x is not None else None),
+        _OPT_STR,
     ] = None,
     copy_attachments: Annotated[
         bool,
@@ -2707,10 +2776,8 @@ async def copy_page(
         destination_parent_id=destination_parent_id,
         copy_attachments=copy_attachments,
     )
-    return json.dumps(
-        {"message": "Page copied successfully", "page": page.to_simplified_dict()},
-        indent=2,
-        ensure_ascii=False,
+    return _dumps(
+        {"message": "Page copied successfully", "page": page.to_simplified_dict()}
     )
 
 
@@ -2766,16 +2833,12 @@ async def confluence_list_page_templates(
             }
             for t in results
         ]
-        return json.dumps(
-            {"templates": simplified, "total": len(simplified)},
-            indent=2,
-            ensure_ascii=False,
-        )
+        return _dumps({"templates": simplified, "total": len(simplified)})
     except MCPAtlassianAuthenticationError as e:
-        logger.error(f"Authentication error listing templates: {e}")
+        logger.error("Authentication error listing templates: %s", e)
         raise
     except Exception as e:
-        logger.error(f"Error listing templates: {e}")
+        logger.error("Error listing templates: %s", e)
         raise
 
 
@@ -2796,22 +2859,20 @@ async def confluence_get_page_template(
     try:
         template = confluence_fetcher.get_page_template(template_id)
         body_value = template.get("body", {}).get("storage", {}).get("value", "")
-        return json.dumps(
+        return _dumps(
             {
                 "templateId": template.get("templateId", ""),
                 "name": template.get("name", ""),
                 "templateType": template.get("templateType", ""),
                 "description": (template.get("description") or {}).get("value", ""),
                 "body": body_value,
-            },
-            indent=2,
-            ensure_ascii=False,
+            }
         )
     except MCPAtlassianAuthenticationError as e:
-        logger.error(f"Authentication error fetching template {template_id}: {e}")
+        logger.error("Authentication error fetching template %s: %s", template_id, e)
         raise
     except Exception as e:
-        logger.error(f"Error fetching template {template_id}: {e}")
+        logger.error("Error fetching template %s: %s", template_id, e)
         raise
 
 
@@ -2820,6 +2881,7 @@ async def confluence_get_page_template(
     annotations={"title": "Create Page from Template", "destructiveHint": False},
 )
 @check_write_access
+@_invalidates_read_cache
 async def confluence_create_page_from_template(
     ctx: Context,
     space_key: Annotated[
@@ -2856,10 +2918,125 @@ async def confluence_create_page_from_template(
             template_id=template_id,
             parent_id=parent_id,
         )
-        return json.dumps(result, indent=2, ensure_ascii=False)
+        return _dumps(result)
     except MCPAtlassianAuthenticationError as e:
-        logger.error(f"Authentication error creating page from template: {e}")
+        logger.error("Authentication error creating page from template: %s", e)
         raise
     except Exception as e:
-        logger.error(f"Error creating page from template {template_id}: {e}")
+        logger.error("Error creating page from template %s: %s", template_id, e)
         raise
+
+
+# Read-only tools that confluence_batch may dispatch to, keyed by tool name.
+# Write tools are deliberately absent so a batch can never bypass
+# READ_ONLY_MODE, and tools returning non-JSON content (attachment downloads,
+# images) are left out because their results cannot be merged into one array.
+_BATCH_TOOLS = {
+    tool.name: tool
+    for tool in (
+        search,
+        get_page,
+        get_page_children,
+        get_space_page_tree,
+        get_comments,
+        get_labels,
+        get_inline_comments,
+        search_user,
+        get_user_details,
+        get_page_history,
+        get_page_diff,
+        get_page_views,
+        get_attachments,
+        get_page_restrictions,
+        confluence_list_page_templates,
+        confluence_get_page_template,
+    )
+}
+_BATCH_MAX_CALLS = 20
+
+
+async def _run_batch_call(call: Any, enabled: Callable[[Any], bool]) -> str:
+    """Run one confluence_batch entry and return its JSON response."""
+    if not isinstance(call, dict) or not isinstance(call.get("tool"), str):
+        raise ValueError("Each call must be an object with a 'tool' name")
+    name = call["tool"]
+    tool = _BATCH_TOOLS.get(name) or _BATCH_TOOLS.get(name.removeprefix("confluence_"))
+    if tool is None or not enabled(tool):
+        raise ValueError(f"Tool '{name}' is not available in a batch")
+    args = call.get("args") or {}
+    if not isinstance(args, dict):
+        raise ValueError(f"Arguments for '{name}' must be an object")
+    result = await tool.run(args)
+    return result.content[0].text  # type: ignore[union-attr]
+
+
+@confluence_mcp.tool(
+    tags={"confluence", "read", "toolset:confluence_pages"},
+    annotations={"title": "Batch Read", "readOnlyHint": True},
+)
+async def batch(
+    ctx: Context,
+    calls: Annotated[
+        str,
+        Field(
+            description=(
+                "JSON array of read-only tool calls to run together. Each object "
+                "should contain:\n"
+                "- tool (required): Tool name, e.g. 'confluence_get_page'\n"
+                "- args (optional): Object of arguments for that tool\n"
+                f"At most {_BATCH_MAX_CALLS} calls. Write tools are not allowed.\n"
+                "Example: [\n"
+                '  {"tool": "confluence_get_page", "args": {"page_id": "123456789"}},\n'
+                '  {"tool": "confluence_get_labels", "args": {"page_id": "123456789"}}\n'
+                "]"
+            )
+        ),
+    ],
+) -> str:
+    """Run several read-only Confluence tools in a single request.
+
+    Args:
+        ctx: The FastMCP context.
+        calls: JSON array string of {tool, args} objects.
+
+    Returns:
+        JSON string with one {tool, result} or {tool, error} entry per call,
+        in the order the calls were given.
+
+    Raises:
+        ValueError: If calls is not a JSON array or has too many entries.
+    """
+    try:
+        calls_list = orjson.loads(calls)
+    except orjson.JSONDecodeError:
+        raise ValueError("Invalid JSON in calls") from None
+    if not isinstance(calls_list, list):
+        raise ValueError("Input 'calls' must be a JSON array string.")
+    if len(calls_list) > _BATCH_MAX_CALLS:
+        raise ValueError(f"A batch may contain at most {_BATCH_MAX_CALLS} calls")
+
+    app_lifespan_ctx = get_app_lifespan_ctx(ctx)
+    enabled_tools = getattr(app_lifespan_ctx, "enabled_tools", None)
+    enabled_toolsets = getattr(app_lifespan_ctx, "enabled_toolsets", None)
+
+    def enabled(tool: Any) -> bool:
+        # Only dispatch to tools the client could also call directly
+        return should_include_tool_by_toolset(
+            tool.tags, enabled_toolsets
+        ) and should_include_tool(f"confluence_{tool.name}", enabled_tools)
+
+    results = await asyncio.gather(
+        *(_run_batch_call(call, enabled) for call in calls_list),
+        return_exceptions=True,
+    )
+
+    entries: list[dict[str, Any]] = []
+    for call, result in zip(calls_list, results, strict=True):
+        name = call.get("tool") if isinstance(call, dict) else None
+        if isinstance(result, BaseException):
+            logger.warning("Batch call to '%s' failed: %s", name, result)
+            entries.append({"tool": name, "error": str(result)})
+        else:
+            # Responses are already JSON, so embed them without re-parsing
+            entries.append({"tool": name, "result": orjson.Fragment(result)})
+    return _dumps(entries)
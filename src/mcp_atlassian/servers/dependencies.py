@@ -28,6 +28,12 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("mcp-atlassian.servers.dependencies")
 
+# Fetchers built from the global (server-wide) config, keyed by service name,
+# for services whose spec sets reuse_global_fetcher.
+# The config is stored alongside the fetcher so a fetcher is only reused for
+# the exact config object it was built from.
+_global_fetchers: dict[str, tuple[Any, Any]] = {}
+
 
 # ---------------------------------------------------------------------------
 # Service specification for generic fetcher resolution
@@ -51,6 +57,9 @@ class _ServiceSpec:
     on_validated: Callable[
         [str, Request, Any, str, str | None], None
     ]  # logging + email backfill
+    # Reuse the global-config fetcher across calls. Only safe for fetchers
+    # without per-instance caches that assume a one-call lifetime.
+    reuse_global_fetcher: bool = False
 
 
 def _jira_on_validated(
@@ -161,6 +170,7 @@ def _confluence_spec() -> _ServiceSpec:
         get_session=lambda f: f.confluence._session,
         validate_fn=lambda f: f.get_current_user_info(),
         on_validated=_confluence_on_validated,
+        reuse_global_fetcher=True,
     )
 
 
@@ -169,7 +179,7 @@ def _confluence_spec() -> _ServiceSpec:
 # ---------------------------------------------------------------------------
 
 
-def _get_app_lifespan_ctx(ctx: Context) -> MainAppContext | None:
+def get_app_lifespan_ctx(ctx: Context) -> MainAppContext | None:
     """Extract MainAppContext from FastMCP lifespan context."""
     lifespan_ctx_dict = ctx.request_context.lifespan_context  # type: ignore
     return (
@@ -187,7 +197,7 @@ def _get_global_config(
     Raises:
         ValueError: If the global config is not available.
     """
-    app_ctx = _get_app_lifespan_ctx(ctx)
+    app_ctx = get_app_lifespan_ctx(ctx)
     config = getattr(app_ctx, spec.config_attr, None) if app_ctx else None
     if not config:
         raise ValueError(
@@ -664,7 +674,7 @@ async def _get_fetcher(ctx: Context, spec: _ServiceSpec) -> Any:
         )
 
     # Fallback to global fetcher
-    app_ctx = _get_app_lifespan_ctx(ctx)
+    app_ctx = get_app_lifespan_ctx(ctx)
     global_config_fallback = (
         getattr(app_ctx, spec.config_attr, None) if app_ctx else None
     )
@@ -675,7 +685,20 @@ async def _get_fetcher(ctx: Context, spec: _ServiceSpec) -> Any:
             f"Global config auth_type: "
             f"{global_config_fallback.auth_type}"
         )
-        return spec.fetcher_class(config=global_config_fallback)
+        # OAuth access tokens are only refreshed when a fetcher is built, so
+        # a fetcher holding a refreshable token must not outlive the call.
+        oauth_config = getattr(global_config_fallback, "oauth_config", None)
+        refreshable = global_config_fallback.auth_type == "oauth" and bool(
+            getattr(oauth_config, "refresh_token", None)
+        )
+        if refreshable or not spec.reuse_global_fetcher:
+            return spec.fetcher_class(config=global_config_fallback)
+        cached_entry = _global_fetchers.get(spec.name)
+        if cached_entry and cached_entry[0] is global_config_fallback:
+            return cached_entry[1]
+        fetcher = spec.fetcher_class(config=global_config_fallback)
+        _global_fetchers[spec.name] = (global_config_fallback, fetcher)
+        return fetcher
 
     logger.error(f"{spec.name} configuration could not be resolved.")
     raise ValueError(
@@ -712,3 +735,31 @@ async def get_confluence_fetcher(ctx: Context) -> ConfluenceFetcher:
         ValueError: If configuration or credentials are invalid.
     """
     return await _get_fetcher(ctx, _confluence_spec())
+
+
+def peek_confluence_config(ctx: Context) -> ConfluenceConfig | None:
+    """Returns the config get_confluence_fetcher would use, if known without building a fetcher.
+
+    Covers a fetcher already stored on request.state and the global
+    fallback for calls without user-specific auth.
+
+    Args:
+        ctx: The FastMCP context.
+
+    Returns:
+        The resolved ConfluenceConfig, or None when a user-specific fetcher
+        still has to be built.
+    """
+    spec = _confluence_spec()
+    try:
+        request: Request = get_http_request()
+    except RuntimeError:
+        pass
+    else:
+        cached = getattr(request.state, spec.state_key, None)
+        if cached:
+            return cached.config
+        if getattr(request.state, "user_atlassian_auth_type", None) is not None:
+            return None
+    app_ctx = get_app_lifespan_ctx(ctx)
+    return getattr(app_ctx, spec.config_attr, None) if app_ctx else None
@@ -51,6 +51,8 @@ def check_write_access(func: F) -> F:
     Assumes the decorated function is async and has `ctx: Context` as its first argument.
     """
     tool_name = func.__name__
+    # e.g., "create_issue" -> "create issue"
+    read_only_message = f"Cannot {tool_name.replace('_', ' ')} in read-only mode."
 
     @wraps(func)
     @handle_tool_errors
@@ -63,11 +65,8 @@ def check_write_access(func: F) -> F:
         )  # type: ignore
 
         if app_lifespan_ctx is not None and app_lifespan_ctx.read_only:
-            action_description = tool_name.replace(
-                "_", " "
-            )  # e.g., "create_issue" -> "create issue"
-            logger.warning(f"Attempted to call tool '{tool_name}' in read-only mode.")
-            raise ValueError(f"Cannot {action_description} in read-only mode.")
+            logger.warning("Attempted to call tool '%s' in read-only mode.", tool_name)
+            raise ValueError(read_only_message)
 
         return await func(ctx, *args, **kwargs)
 
@@ -0,0 +1,115 @@
+"""Short-lived result cache for read-only MCP tools."""
+
+import asyncio
+import hashlib
+import json
+import logging
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Any
+
+from cachetools import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+class ToolResultCache:
+    """Read-aside cache of serialized tool responses.
+
+    Entries are keyed on the tool name, the caller's principal and the fully
+    bound tool arguments, and hold the final JSON string returned to the
+    client, so a hit skips the Atlassian API call and the serialization.
+    Concurrent misses for the same key are coalesced into a single call.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 30) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of cached responses (least recently used
+                entries are evicted first).
+            ttl: Time-to-live of each entry in seconds.
+        """
+        self._results: TTLCache[str, str] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._pending: dict[str, asyncio.Future[str | None]] = {}
+        # Bumped by clear() so a call that started before an invalidation
+        # does not repopulate the cache with a stale response.
+        self._generation = 0
+
+    @staticmethod
+    def make_key(tool_name: str, principal: str, arguments: Mapping[str, Any]) -> str:
+        """Build the cache key for a tool call.
+
+        Args:
+            tool_name: Name of the tool being called.
+            principal: Identity of the caller; results are never shared
+                between different principals.
+            arguments: The bound tool arguments (excluding the context).
+
+        Returns:
+            A hex digest uniquely identifying the call.
+        """
+        serialized_args = json.dumps(arguments, sort_keys=True, default=str)
+        raw = f"{tool_name}|{principal}|{serialized_args}"
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[str]],
+        cacheable: Callable[[str], bool] | None = None,
+    ) -> str:
+        """Return the cached response for key, computing it on a miss.
+
+        Args:
+            key: Cache key from make_key().
+            compute: Coroutine factory producing the response on a miss.
+            cacheable: Optional predicate deciding whether a computed
+                response may be stored; rejected responses are still returned.
+
+        Returns:
+            The cached or freshly computed response.
+        """
+        while True:
+            cached = self._results.get(key)
+            if cached is not None:
+                logger.debug(f"Tool result cache hit for key {key}")
+                return cached
+
+            pending = self._pending.get(key)
+            if pending is None:
+                break
+            shared = await asyncio.shield(pending)
+            if shared is not None:
+                return shared
+            # The call we were waiting on was cancelled; run it ourselves
+
+        generation = self._generation
+        # Resolves to None when this call is cancelled, telling waiters to retry
+        future: asyncio.Future[str | None] = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            result = await compute()
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved when nobody else was waiting
+            future.exception()
+            raise
+        except BaseException:
+            future.set_result(None)
+            raise
+        else:
+            if generation == self._generation and (
+                cacheable is None or cacheable(result)
+            ):
+                self._results[key] = result
+            future.set_result(result)
+            return result
+        finally:
+            if self._pending.get(key) is future:
+                del self._pending[key]
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._generation += 1
+        self._results.clear()
+        self._pending.clear()
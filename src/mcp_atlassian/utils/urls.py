@@ -6,6 +6,11 @@ import re
 import socket
 from urllib.parse import urlparse
 
+# Loopback and private IPv4 ranges, which always indicate Server/Data Center
+_PRIVATE_HOST_RE = re.compile(
+    r"^(?:127\.|192\.168\.|10\.|172\.(?:1[6-9]|2[0-9]|3[0-1])\.)"
+)
+
 
 def resolve_relative_url(url: str, base_url: str) -> str:
     """Resolve a relative URL against a base URL.
@@ -42,13 +47,7 @@ def is_atlassian_cloud_url(url: str) -> bool:
     hostname = parsed_url.hostname or ""
 
     # Check for localhost or IP address
-    if (
-        hostname == "localhost"
-        or re.match(r"^127\.", hostname)
-        or re.match(r"^192\.168\.", hostname)
-        or re.match(r"^10\.", hostname)
-        or re.match(r"^172\.(1[6-9]|2[0-9]|3[0-1])\.", hostname)
-    ):
+    if hostname == "localhost" or _PRIVATE_HOST_RE.match(hostname):
         return False
 
     # The standard check for Atlassian cloud domains
@@ -1,7 +1,10 @@
 """Tests for the Confluence utility functions."""
 
 from mcp_atlassian.confluence.constants import RESERVED_CQL_WORDS
-from mcp_atlassian.confluence.utils import quote_cql_identifier_if_needed
+from mcp_atlassian.confluence.utils import (
+    quote_cql_identifier_if_needed,
+    quote_cql_string,
+)
 
 
 class TestCQLQuoting:
@@ -55,3 +58,9 @@ class TestCQLQuoting:
         assert quote_cql_identifier_if_needed("DEV") == "DEV"
         assert quote_cql_identifier_if_needed("MYSPACE") == "MYSPACE"
         assert quote_cql_identifier_if_needed("documentation") == "documentation"
+
+    def test_quote_cql_string(self):
+        """Test quoting free text as a CQL string literal."""
+        assert quote_cql_string("First Last") == '"First Last"'
+        assert quote_cql_string('say "hi"') == '"say \\"hi\\""'
+        assert quote_cql_string("back\\slash") == '"back\\\\slash"'
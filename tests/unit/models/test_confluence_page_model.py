@@ -104,6 +104,20 @@ class TestConfluencePage:
         # URL should be included
         assert "url" in simplified
 
+    def test_to_metadata_dict_omits_content(self, confluence_page_data):
+        """Test that to_metadata_dict matches to_simplified_dict without content."""
+        page = ConfluencePage.from_api_response(
+            confluence_page_data, content_override="Body text"
+        )
+
+        simplified = page.to_simplified_dict()
+        metadata = page.to_metadata_dict()
+
+        assert "content" in simplified
+        assert "content" not in metadata
+        simplified.pop("content")
+        assert metadata == simplified
+
     def test_from_api_response_with_expandable_space(self):
         """Test creating a ConfluencePage from data with space info in _expandable."""
         page_data = {
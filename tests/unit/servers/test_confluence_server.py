@@ -10,6 +10,7 @@ import pytest
 from fastmcp import Client, FastMCP
 from fastmcp.client import FastMCPTransport
 from fastmcp.exceptions import ToolError
+from requests.exceptions import HTTPError
 from starlette.requests import Request
 
 from src.mcp_atlassian.confluence import ConfluenceFetcher
@@ -22,6 +23,21 @@ from src.mcp_atlassian.utils.oauth import OAuthConfig
 logger = logging.getLogger(__name__)
 
 
+@pytest.fixture(autouse=True)
+def clear_read_cache():
+    """Ensure cached read-tool responses never leak between tests."""
+    from src.mcp_atlassian.servers.confluence import (
+        _SITE_SEARCH_SUPPORTED,
+        _read_cache,
+    )
+
+    _read_cache.clear()
+    _SITE_SEARCH_SUPPORTED.clear()
+    yield
+    _read_cache.clear()
+    _SITE_SEARCH_SUPPORTED.clear()
+
+
 @pytest.fixture
 def mock_confluence_fetcher():
     """Create a mocked ConfluenceFetcher instance for testing."""
@@ -38,6 +54,11 @@ def mock_confluence_fetcher():
             "format": "markdown",
         },
     }
+    mock_page.to_metadata_dict.return_value = {
+        "id": "123456",
+        "title": "Test Page Mock Title",
+        "url": "https://example.atlassian.net/wiki/spaces/TEST/pages/123456/Test+Page",
+    }
     mock_page.id = "123456"
     mock_page.content = "This is a test page content in Markdown"
 
@@ -208,6 +229,7 @@ def test_confluence_mcp(mock_confluence_fetcher, mock_base_confluence_config):
     from src.mcp_atlassian.servers.confluence import (
         add_comment,
         add_label,
+        batch,
         create_page,
         delete_attachment,
         delete_page,
@@ -215,6 +237,7 @@ def test_confluence_mcp(mock_confluence_fetcher, mock_base_confluence_config):
         download_content_attachments,
         get_attachments,
         get_comments,
+        get_inline_comments,
         get_labels,
         get_page,
         get_page_children,
@@ -251,6 +274,7 @@ def test_confluence_mcp(mock_confluence_fetcher, mock_base_confluence_config):
     confluence_sub_mcp.add_tool(get_page_children)
     confluence_sub_mcp.add_tool(get_space_page_tree)
     confluence_sub_mcp.add_tool(get_comments)
+    confluence_sub_mcp.add_tool(get_inline_comments)
     confluence_sub_mcp.add_tool(add_comment)
     confluence_sub_mcp.add_tool(get_labels)
     confluence_sub_mcp.add_tool(add_label)
@@ -267,6 +291,7 @@ def test_confluence_mcp(mock_confluence_fetcher, mock_base_confluence_config):
     confluence_sub_mcp.add_tool(delete_attachment)
     confluence_sub_mcp.add_tool(get_page_images)
     confluence_sub_mcp.add_tool(set_content_property)
+    confluence_sub_mcp.add_tool(batch)
 
     test_mcp.mount(confluence_sub_mcp, prefix="confluence")
 
@@ -397,6 +422,148 @@ async def test_search(client, mock_confluence_fetcher):
     assert result_data[0]["title"] == "Test Page Mock Title"
 
 
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "query",
+    [
+        "type=page AND space=DEV",
+        'title~"Meeting Notes"',
+        'created >= "2023-01-01"',
+        "creator = currentUser()",
+        "label = docs OR label = guides",
+    ],
+)
+async def test_search_cql_query_passed_through(client, mock_confluence_fetcher, query):
+    """Test that queries recognised as CQL are not wrapped in siteSearch."""
+    await client.call_tool("confluence_search", {"query": query})
+
+    args, _ = mock_confluence_fetcher.search.call_args
+    assert args[0] == query
+
+
+def _http_error(status_code):
+    response = MagicMock()
+    response.status_code = status_code
+    return HTTPError(f"{status_code} Client Error", response=response)
+
+
+@pytest.mark.anyio
+async def test_search_site_search_unsupported_is_remembered(
+    client, mock_confluence_fetcher
+):
+    """Test that a deployment rejecting siteSearch goes straight to text search."""
+    pages = mock_confluence_fetcher.search.return_value
+    mock_confluence_fetcher.search.side_effect = [_http_error(400), pages, pages]
+
+    await client.call_tool("confluence_search", {"query": "first"})
+    await client.call_tool("confluence_search", {"query": "second"})
+
+    queries = [c.args[0] for c in mock_confluence_fetcher.search.call_args_list]
+    assert queries == [
+        'siteSearch ~ "first"',
+        'text ~ "first"',
+        'text ~ "second"',
+    ]
+
+
+@pytest.mark.anyio
+async def test_search_site_search_transient_failure_not_remembered(
+    client, mock_confluence_fetcher
+):
+    """Test that non-400 siteSearch failures fall back without being cached."""
+    pages = mock_confluence_fetcher.search.return_value
+    mock_confluence_fetcher.search.side_effect = [_http_error(500), pages, pages]
+
+    await client.call_tool("confluence_search", {"query": "first"})
+    await client.call_tool("confluence_search", {"query": "second"})
+
+    queries = [c.args[0] for c in mock_confluence_fetcher.search.call_args_list]
+    assert queries == [
+        'siteSearch ~ "first"',
+        'text ~ "first"',
+        'siteSearch ~ "second"',
+    ]
+
+
+@pytest.mark.anyio
+async def test_search_repeated_call_served_from_cache(client, mock_confluence_fetcher):
+    """Test that an identical repeated search does not hit Confluence again."""
+    first = await client.call_tool("confluence_search", {"query": "test search"})
+    second = await client.call_tool("confluence_search", {"query": "test search"})
+
+    mock_confluence_fetcher.search.assert_called_once()
+    assert first.content[0].text == second.content[0].text
+
+    await client.call_tool("confluence_search", {"query": "other search"})
+    assert mock_confluence_fetcher.search.call_count == 2
+
+
+@pytest.mark.anyio
+async def test_cache_hit_does_not_resolve_fetcher(
+    test_confluence_mcp, mock_confluence_fetcher, mock_base_confluence_config
+):
+    """Test that a cached read builds no fetcher, not even for the cache key."""
+    get_fetcher = AsyncMock(return_value=mock_confluence_fetcher)
+    with (
+        patch(
+            "src.mcp_atlassian.servers.confluence.get_confluence_fetcher",
+            get_fetcher,
+        ),
+        patch(
+            "src.mcp_atlassian.servers.confluence.peek_confluence_config",
+            return_value=mock_base_confluence_config,
+        ),
+    ):
+        async with Client(transport=FastMCPTransport(test_confluence_mcp)) as client:
+            for _ in range(2):
+                await client.call_tool("confluence_get_labels", {"page_id": "123456"})
+
+    get_fetcher.assert_awaited_once()
+    mock_confluence_fetcher.get_page_labels.assert_called_once()
+
+
+@pytest.mark.anyio
+async def test_write_tool_invalidates_read_cache(client, mock_confluence_fetcher):
+    """Test that a write tool forces the next read to hit Confluence."""
+    await client.call_tool("confluence_get_labels", {"page_id": "123456"})
+    await client.call_tool(
+        "confluence_add_label", {"page_id": "123456", "name": "new-label"}
+    )
+    await client.call_tool("confluence_get_labels", {"page_id": "123456"})
+
+    assert mock_confluence_fetcher.get_page_labels.call_count == 2
+
+
+@pytest.mark.anyio
+async def test_get_page_error_is_not_cached(client, mock_confluence_fetcher):
+    """Test that a failed get_page is retried instead of served from cache."""
+    page = mock_confluence_fetcher.get_page_content.return_value
+    mock_confluence_fetcher.get_page_content.side_effect = [
+        Exception("Connection reset"),
+        page,
+    ]
+
+    first = await client.call_tool("confluence_get_page", {"page_id": "123456"})
+    second = await client.call_tool("confluence_get_page", {"page_id": "123456"})
+
+    assert "error" in json.loads(first.content[0].text)
+    assert "metadata" in json.loads(second.content[0].text)
+    assert mock_confluence_fetcher.get_page_content.call_count == 2
+
+
+@pytest.mark.anyio
+async def test_response_is_compact_utf8_json(client, mock_confluence_fetcher):
+    """Test that tool responses are compact JSON with non-ASCII kept as-is."""
+    mock_label = MagicMock()
+    mock_label.to_simplified_dict.return_value = {"id": "lbl1", "name": "café"}
+    mock_confluence_fetcher.get_page_labels.return_value = [mock_label]
+
+    response = await client.call_tool("confluence_get_labels", {"page_id": "123456"})
+
+    text = response.content[0].text
+    assert text == '[{"id":"lbl1","name":"café"}]'
+
+
 @pytest.mark.anyio
 async def test_get_page(client, mock_confluence_fetcher):
     """Test the get_page tool with default parameters."""
@@ -431,6 +598,43 @@ async def test_get_page_no_metadata(client, mock_confluence_fetcher):
     assert "This is a test page content" in result_data["content"]["value"]
 
 
+@pytest.mark.anyio
+async def test_get_page_id_overrides_title(client, mock_confluence_fetcher, caplog):
+    """Test that title and space_key are ignored, with a warning, given page_id."""
+    with caplog.at_level(logging.WARNING):
+        await client.call_tool(
+            "confluence_get_page",
+            {"page_id": "123456", "title": "Other", "space_key": "DEV"},
+        )
+
+    mock_confluence_fetcher.get_page_by_title.assert_not_called()
+    assert "title and space_key parameters will be ignored" in caplog.text
+
+
+@pytest.mark.anyio
+async def test_get_page_not_found(client, mock_confluence_fetcher):
+    """Test get_page when the fetcher finds no page."""
+    mock_confluence_fetcher.get_page_content.return_value = None
+
+    response = await client.call_tool("confluence_get_page", {"page_id": "123456"})
+
+    assert json.loads(response.content[0].text) == {
+        "error": "Page not found with the provided identifiers."
+    }
+
+
+@pytest.mark.anyio
+async def test_get_page_metadata_without_content(client, mock_confluence_fetcher):
+    """Test get_page returning only metadata when include_content is false."""
+    response = await client.call_tool(
+        "confluence_get_page", {"page_id": "123456", "include_content": False}
+    )
+
+    result_data = json.loads(response.content[0].text)
+    assert result_data["metadata"]["title"] == "Test Page Mock Title"
+    assert "content" not in result_data["metadata"]
+
+
 @pytest.mark.anyio
 async def test_get_page_no_markdown(client, mock_confluence_fetcher):
     """Test get_page with HTML content format."""
@@ -483,6 +687,21 @@ async def test_get_page_children(client, mock_confluence_fetcher):
     assert result_data["results"][0]["title"] == "Test Page Mock Title"
 
 
+@pytest.mark.anyio
+async def test_get_page_children_processing_error(client, mock_confluence_fetcher):
+    """Test that a failure while simplifying child pages yields an error payload."""
+    broken_page = MagicMock(spec=ConfluencePage)
+    broken_page.to_simplified_dict.side_effect = ValueError("bad page")
+    mock_confluence_fetcher.get_page_children.return_value = [broken_page]
+
+    response = await client.call_tool(
+        "confluence_get_page_children", {"parent_id": "123456"}
+    )
+
+    result_data = json.loads(response.content[0].text)
+    assert "Failed to get child pages" in result_data["error"]
+
+
 @pytest.mark.anyio
 async def test_get_space_page_tree(client, mock_confluence_fetcher):
     """Test the get_space_page_tree tool."""
@@ -568,6 +787,42 @@ async def test_add_comment(client, mock_confluence_fetcher):
     assert result_data["comment"]["created"] == "2023-08-01T13:00:00.000Z"
 
 
+@pytest.mark.anyio
+async def test_add_comment_error(client, mock_confluence_fetcher):
+    """Test add_comment reports the exception message on failure."""
+    mock_confluence_fetcher.add_comment.side_effect = Exception("Page is locked")
+    response = await client.call_tool(
+        "confluence_add_comment",
+        {"page_id": "123456", "body": "Test comment content"},
+    )
+
+    result_data = json.loads(response.content[0].text)
+    assert result_data == {
+        "success": False,
+        "message": "Error adding comment to page 123456",
+        "error": "Page is locked",
+    }
+
+
+@pytest.mark.anyio
+async def test_add_comment_conversion_error(client, mock_confluence_fetcher):
+    """Test a created comment that fails to convert returns the failure payload."""
+    mock_confluence_fetcher.add_comment.return_value.to_simplified_dict.side_effect = (
+        ValueError("bad comment")
+    )
+    response = await client.call_tool(
+        "confluence_add_comment",
+        {"page_id": "123456", "body": "Test comment content"},
+    )
+
+    result_data = json.loads(response.content[0].text)
+    assert result_data == {
+        "success": False,
+        "message": "Error adding comment to page 123456",
+        "error": "bad comment",
+    }
+
+
 @pytest.mark.anyio
 async def test_get_labels(client, mock_confluence_fetcher):
     """Test retrieving page labels."""
@@ -578,6 +833,56 @@ async def test_get_labels(client, mock_confluence_fetcher):
     assert result_data[0]["name"] == "test-label"
 
 
+@pytest.mark.anyio
+async def test_batch(client, mock_confluence_fetcher):
+    """Test running several read tools in one batch call."""
+    calls = [
+        {"tool": "confluence_get_page", "args": {"page_id": "123456"}},
+        {"tool": "get_labels", "args": {"page_id": "123456"}},
+        {"tool": "confluence_get_comments", "args": {"page_id": "123456"}},
+    ]
+    response = await client.call_tool("confluence_batch", {"calls": json.dumps(calls)})
+    result_data = json.loads(response.content[0].text)
+
+    assert [entry["tool"] for entry in result_data] == [
+        "confluence_get_page",
+        "get_labels",
+        "confluence_get_comments",
+    ]
+    assert result_data[0]["result"]["metadata"]["title"] == "Test Page Mock Title"
+    assert result_data[1]["result"][0]["name"] == "test-label"
+    assert isinstance(result_data[2]["result"], list)
+    mock_confluence_fetcher.get_page_labels.assert_called_once_with("123456")
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "call",
+    [
+        {"tool": "confluence_add_label", "args": {"page_id": "1", "name": "x"}},
+        {"tool": "confluence_no_such_tool"},
+        {"tool": "confluence_get_labels", "args": {}},
+        "not-an-object",
+    ],
+)
+async def test_batch_rejects_invalid_calls(client, mock_confluence_fetcher, call):
+    """Test that invalid batch entries are reported without failing the batch."""
+    calls = [call, {"tool": "confluence_get_labels", "args": {"page_id": "123456"}}]
+    response = await client.call_tool("confluence_batch", {"calls": json.dumps(calls)})
+    result_data = json.loads(response.content[0].text)
+
+    assert "error" in result_data[0]
+    assert result_data[1]["result"][0]["name"] == "test-label"
+    mock_confluence_fetcher.add_page_label.assert_not_called()
+
+
+@pytest.mark.anyio
+async def test_batch_invalid_json(client):
+    """Test that a malformed calls array fails the whole batch."""
+    with pytest.raises(ToolError, match="Invalid JSON in calls"):
+        await client.call_tool("confluence_batch", {"calls": "[not json"})
+
+
 @pytest.mark.anyio
 async def test_add_label(client, mock_confluence_fetcher):
     """Test adding a label to a page."""
@@ -612,6 +917,15 @@ async def test_search_user(client, mock_confluence_fetcher):
     assert result_data[0]["user"]["display_name"] == "First Last"
 
 
+@pytest.mark.anyio
+async def test_search_user_simple_term_is_quoted(client, mock_confluence_fetcher):
+    """Test that a plain name is wrapped and escaped as a fullname search."""
+    await client.call_tool("confluence_search_user", {"query": 'Jane "JJ" Doe'})
+
+    args, _ = mock_confluence_fetcher.search_user.call_args
+    assert args[0] == 'user.fullname ~ "Jane \\"JJ\\" Doe"'
+
+
 @pytest.mark.anyio
 async def test_create_page_with_numeric_parent_id(client, mock_confluence_fetcher):
     """Test creating a page with numeric parent_id (integer) - should convert to string."""
@@ -638,6 +952,60 @@ async def test_create_page_with_numeric_parent_id(client, mock_confluence_fetche
     assert "content" not in result_data["page"]
 
 
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "content_format,is_markdown,representation,anchors,table_layout",
+    [
+        ("markdown", True, None, True, "wide"),
+        ("wiki", False, "wiki", False, None),
+        ("storage", False, "storage", False, None),
+    ],
+)
+async def test_create_page_content_format_mapping(
+    client,
+    mock_confluence_fetcher,
+    content_format,
+    is_markdown,
+    representation,
+    anchors,
+    table_layout,
+):
+    """Test that content_format selects the fetcher's conversion arguments."""
+    await client.call_tool(
+        "confluence_create_page",
+        {
+            "space_key": "TEST",
+            "title": "Test Page",
+            "content": "Test content",
+            "content_format": content_format,
+            "enable_heading_anchors": True,
+            "table_layout": "wide",
+        },
+    )
+
+    call_kwargs = mock_confluence_fetcher.create_page.call_args.kwargs
+    assert call_kwargs["is_markdown"] is is_markdown
+    assert call_kwargs["content_representation"] == representation
+    assert call_kwargs["enable_heading_anchors"] is anchors
+    assert call_kwargs["table_layout"] == table_layout
+
+
+@pytest.mark.anyio
+async def test_create_page_invalid_content_format(client, mock_confluence_fetcher):
+    """Test that an unsupported content_format is rejected."""
+    with pytest.raises(ToolError, match="Invalid content_format"):
+        await client.call_tool(
+            "confluence_create_page",
+            {
+                "space_key": "TEST",
+                "title": "Test Page",
+                "content": "Test content",
+                "content_format": "html",
+            },
+        )
+    mock_confluence_fetcher.create_page.assert_not_called()
+
+
 @pytest.mark.anyio
 async def test_create_page_with_string_parent_id(client, mock_confluence_fetcher):
     """Test creating a page with string parent_id - should remain unchanged."""
@@ -788,6 +1156,41 @@ async def test_get_page_include_comments(client, mock_confluence_fetcher):
     assert result_data["comments"][0]["id"] == "789"
 
 
+@pytest.mark.anyio
+async def test_get_page_include_comments_conversion_error(
+    client, mock_confluence_fetcher
+):
+    """Test a comment that fails to convert degrades to an empty list."""
+    broken_comment = MagicMock()
+    broken_comment.to_simplified_dict.side_effect = ValueError("bad comment")
+    mock_confluence_fetcher.get_page_comments.return_value = [broken_comment]
+
+    response = await client.call_tool(
+        "confluence_get_page", {"page_id": "123456", "include": "comments"}
+    )
+
+    result_data = json.loads(response.content[0].text)
+    assert "metadata" in result_data
+    assert result_data["comments"] == []
+
+
+@pytest.mark.anyio
+async def test_get_inline_comments_conversion_error(client, mock_confluence_fetcher):
+    """Test a comment that fails to convert returns the failure payload."""
+    broken_comment = MagicMock()
+    broken_comment.to_simplified_dict.side_effect = ValueError("bad comment")
+    mock_confluence_fetcher.get_inline_comments.return_value = [broken_comment]
+
+    response = await client.call_tool(
+        "confluence_get_inline_comments", {"page_id": "123456"}
+    )
+
+    result_data = json.loads(response.content[0].text)
+    assert result_data["success"] is False
+    assert result_data["message"] == "Error getting inline comments for page 123456"
+    assert "error" in result_data
+
+
 @pytest.mark.anyio
 async def test_get_page_include_labels(client, mock_confluence_fetcher):
     """Test get_page with include='labels' inlines label data."""
@@ -1236,6 +1639,25 @@ async def test_set_content_property_json_object(client, mock_confluence_fetcher)
     assert result_data["editor"] == {"version": 2}
 
 
+@pytest.mark.anyio
+async def test_set_content_property_keeps_large_integers(
+    client, mock_confluence_fetcher
+):
+    """Test set_content_property keeps integers beyond 64 bits exact."""
+    large = 2**64
+    mock_confluence_fetcher.set_content_property.return_value = {"counter": large}
+
+    response = await client.call_tool(
+        "confluence_set_content_property",
+        {"page_id": "123456", "key": "counter", "value": str(large)},
+    )
+
+    mock_confluence_fetcher.set_content_property.assert_called_once_with(
+        "123456", "counter", large
+    )
+    assert json.loads(response.content[0].text) == {"counter": large}
+
+
 @pytest.mark.anyio
 async def test_set_content_property_invalid_json(client, mock_confluence_fetcher):
     """Test set_content_property rejects invalid JSON value."""
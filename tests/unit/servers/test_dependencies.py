@@ -15,6 +15,7 @@ from mcp_atlassian.servers.dependencies import (
     _resolve_bearer_auth_type,
     get_confluence_fetcher,
     get_jira_fetcher,
+    peek_confluence_config,
 )
 from mcp_atlassian.utils.oauth import OAuthConfig
 from tests.utils.assertions import assert_mock_called_with_partial
@@ -734,6 +735,28 @@ class TestGetJiraFetcher:
             mock_jira_fetcher_class.reset_mock()
             mock_get_http_request.reset_mock()
 
+    @patch("mcp_atlassian.servers.dependencies.get_http_request")
+    @patch("mcp_atlassian.servers.dependencies.JiraFetcher")
+    async def test_global_fallback_does_not_reuse_fetcher(
+        self,
+        mock_jira_fetcher_class,
+        mock_get_http_request,
+        mock_context,
+        config_factory,
+    ):
+        """Test that each call gets a new global JiraFetcher with fresh caches."""
+        mock_get_http_request.side_effect = RuntimeError("No HTTP context")
+        _setup_mock_context(mock_context, config_factory.create_app_context())
+        mock_jira_fetcher_class.side_effect = lambda config: _create_mock_fetcher(
+            JiraFetcher
+        )
+
+        first = await get_jira_fetcher(mock_context)
+        second = await get_jira_fetcher(mock_context)
+
+        assert first is not second
+        assert mock_jira_fetcher_class.call_count == 2
+
     @pytest.mark.parametrize(
         "error_scenario,expected_error_match",
         [
@@ -1073,6 +1096,108 @@ class TestGetConfluenceFetcher:
             mock_confluence_fetcher_class.reset_mock()
             mock_get_http_request.reset_mock()
 
+    @patch("mcp_atlassian.servers.dependencies.get_http_request")
+    @patch("mcp_atlassian.servers.dependencies.ConfluenceFetcher")
+    async def test_global_fallback_reuses_fetcher(
+        self,
+        mock_confluence_fetcher_class,
+        mock_get_http_request,
+        mock_context,
+        config_factory,
+    ):
+        """Test that the global fetcher is built once per global config."""
+        mock_get_http_request.side_effect = RuntimeError("No HTTP context")
+        app_context = config_factory.create_app_context()
+        _setup_mock_context(mock_context, app_context)
+        mock_confluence_fetcher_class.side_effect = lambda config: _create_mock_fetcher(
+            ConfluenceFetcher
+        )
+
+        first = await get_confluence_fetcher(mock_context)
+        second = await get_confluence_fetcher(mock_context)
+
+        assert first is second
+        mock_confluence_fetcher_class.assert_called_once()
+
+        # A different global config must not be served the cached fetcher
+        _setup_mock_context(mock_context, config_factory.create_app_context())
+        third = await get_confluence_fetcher(mock_context)
+
+        assert third is not first
+        assert mock_confluence_fetcher_class.call_count == 2
+
+    @patch("mcp_atlassian.servers.dependencies.get_http_request")
+    async def test_global_fallback_refreshes_expired_oauth_token(
+        self,
+        mock_get_http_request,
+        mock_context,
+        config_factory,
+    ):
+        """Test that a refreshable global OAuth token is refreshed once expired."""
+        mock_get_http_request.side_effect = RuntimeError("No HTTP context")
+        confluence_config = config_factory.create_confluence_config(auth_type="oauth")
+        oauth_config = confluence_config.oauth_config
+        _setup_mock_context(
+            mock_context,
+            config_factory.create_app_context(confluence_config=confluence_config),
+        )
+
+        def refresh():
+            oauth_config.access_token = "refreshed-token"
+            oauth_config.expires_at = 9999999999.0
+            return True
+
+        with patch.object(
+            OAuthConfig, "refresh_access_token", side_effect=refresh
+        ) as mock_refresh:
+            first = await get_confluence_fetcher(mock_context)
+            mock_refresh.assert_not_called()
+
+            oauth_config.expires_at = 1.0
+            second = await get_confluence_fetcher(mock_context)
+
+        mock_refresh.assert_called_once()
+        assert second.confluence._session.headers["Authorization"] == (
+            "Bearer refreshed-token"
+        )
+        assert first.confluence._session.headers["Authorization"] != (
+            "Bearer refreshed-token"
+        )
+
+    @patch("mcp_atlassian.servers.dependencies.get_http_request")
+    def test_peek_confluence_config(
+        self, mock_get_http_request, mock_context, mock_request, config_factory
+    ):
+        """Test which configs can be resolved without building a fetcher."""
+        app_context = config_factory.create_app_context()
+        _setup_mock_context(mock_context, app_context)
+        mock_get_http_request.return_value = mock_request
+
+        # No user-specific auth: the global config is used
+        _setup_mock_request_state(mock_request)
+        assert peek_confluence_config(mock_context) is (
+            app_context.full_confluence_config
+        )
+
+        # A user-specific fetcher still has to be built
+        _setup_mock_request_state(
+            mock_request,
+            {"auth_type": "oauth", "token": "user-token", "email": None},
+        )
+        assert peek_confluence_config(mock_context) is None
+
+        # A fetcher already on request.state
+        cached_fetcher = _create_mock_fetcher(ConfluenceFetcher)
+        cached_fetcher.config = config_factory.create_confluence_config()
+        _setup_mock_request_state(mock_request, cached_fetcher=cached_fetcher)
+        assert peek_confluence_config(mock_context) is cached_fetcher.config
+
+        # Outside an HTTP request
+        mock_get_http_request.side_effect = RuntimeError("No HTTP context")
+        assert peek_confluence_config(mock_context) is (
+            app_context.full_confluence_config
+        )
+
     @pytest.mark.parametrize(
         "email_scenario,expected_email",
         [
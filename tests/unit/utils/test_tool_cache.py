@@ -0,0 +1,144 @@
+"""Tests for the read-only tool result cache."""
+
+import asyncio
+
+import pytest
+
+from mcp_atlassian.utils.tool_cache import ToolResultCache
+
+
+def test_make_key_is_stable_and_argument_order_independent():
+    key_a = ToolResultCache.make_key("search", "user-a", {"query": "x", "limit": 10})
+    key_b = ToolResultCache.make_key("search", "user-a", {"limit": 10, "query": "x"})
+    assert key_a == key_b
+
+
+@pytest.mark.parametrize(
+    "tool_name,principal,arguments",
+    [
+        ("get_page", "user-a", {"query": "x", "limit": 10}),
+        ("search", "user-b", {"query": "x", "limit": 10}),
+        ("search", "user-a", {"query": "y", "limit": 10}),
+    ],
+)
+def test_make_key_differs_per_tool_principal_and_arguments(
+    tool_name, principal, arguments
+):
+    base = ToolResultCache.make_key("search", "user-a", {"query": "x", "limit": 10})
+    assert ToolResultCache.make_key(tool_name, principal, arguments) != base
+
+
+@pytest.mark.asyncio
+async def test_get_or_compute_caches_result():
+    cache = ToolResultCache()
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        return "result"
+
+    assert await cache.get_or_compute("key", compute) == "result"
+    assert await cache.get_or_compute("key", compute) == "result"
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_get_or_compute_skips_uncacheable_results():
+    cache = ToolResultCache()
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        return "error"
+
+    for _ in range(2):
+        assert (
+            await cache.get_or_compute("key", compute, cacheable=lambda r: False)
+            == "error"
+        )
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_get_or_compute_does_not_cache_exceptions():
+    cache = ToolResultCache()
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        raise ValueError("boom")
+
+    for _ in range(2):
+        with pytest.raises(ValueError, match="boom"):
+            await cache.get_or_compute("key", compute)
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_get_or_compute_coalesces_concurrent_misses():
+    cache = ToolResultCache()
+    calls = 0
+    release = asyncio.Event()
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "result"
+
+    tasks = [
+        asyncio.create_task(cache.get_or_compute("key", compute)) for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*tasks) == ["result"] * 3
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_call_is_retried_by_waiters():
+    cache = ToolResultCache()
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.Event().wait()
+        return "result"
+
+    first = asyncio.create_task(cache.get_or_compute("key", compute))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(cache.get_or_compute("key", compute))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await waiter == "result"
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_clear_discards_results_and_in_flight_calls():
+    cache = ToolResultCache()
+    release = asyncio.Event()
+
+    async def slow_compute():
+        await release.wait()
+        return "stale"
+
+    task = asyncio.create_task(cache.get_or_compute("key", slow_compute))
+    await asyncio.sleep(0)
+    cache.clear()
+    release.set()
+    assert await task == "stale"
+
+    async def fresh_compute():
+        return "fresh"
+
+    assert await cache.get_or_compute("key", fresh_compute) == "fresh"